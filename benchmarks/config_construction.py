@@ -0,0 +1,70 @@
+"""
+Benchmark loading and using a config with many columns.
+
+Usage: python benchmarks/config_construction.py [num_columns]
+"""
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+from smart_pandas.config.config_utils import read_config
+from smart_pandas.schema import build_schema
+from smart_pandas.state import MLStage, State, StateName
+
+
+def make_config(num_columns: int) -> dict:
+    """Make a config with the required columns plus `num_columns` raw model features."""
+    columns = [
+        {"name": "id", "data_schema": {"dtype": "str"}, "tags": ["unique_identifier"]},
+        {"name": "timestamp", "data_schema": {"dtype": "datetime"}, "tags": ["row_timestamp"]},
+        {"name": "target", "data_schema": {"dtype": "float"}, "tags": ["target"]},
+    ]
+    columns += [
+        {
+            "name": f"feature_{i}",
+            "data_schema": {"dtype": "float" if i % 2 else "int", "nullable": bool(i % 3)},
+            "tags": ["raw_feature", "model_feature"],
+            "description": f"Feature {i}",
+        }
+        for i in range(num_columns)
+    ]
+    return {"name": "benchmark", "columns": columns}
+
+
+def benchmark(path: Path) -> dict[str, float]:
+    """Time reading the config file, fingerprinting it and building the schema of the raw training state."""
+    start = time.perf_counter()
+    config = read_config(str(path))
+    loaded = time.perf_counter()
+    _ = config.fingerprint
+    fingerprinted = time.perf_counter()
+    build_schema(config, State(StateName.RAW, MLStage.TRAINING))
+    built = time.perf_counter()
+    return {
+        "read_config": loaded - start,
+        "fingerprint": fingerprinted - loaded,
+        "build_schema": built - fingerprinted,
+        "total": built - start,
+    }
+
+
+def main(num_columns: int) -> None:
+    config = make_config(num_columns)
+    with tempfile.TemporaryDirectory() as directory:
+        yaml_path = Path(directory) / "config.yaml"
+        yaml_path.write_text(yaml.safe_dump(config, sort_keys=False))
+        json_path = Path(directory) / "config.json"
+        json_path.write_text(json.dumps(config))
+
+        print(f"{num_columns} columns")
+        for path in [yaml_path, json_path]:
+            timings = benchmark(path)
+            print(f"{path.suffix}: " + ", ".join(f"{step} {seconds:.2f}s" for step, seconds in timings.items()))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,60 @@
+"""
+Benchmark getting the model features and target of a validated frame, with and without the feature cache.
+
+Usage: python benchmarks/feature_cache.py [num_rows]
+"""
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from smart_pandas.config.config_utils import read_config
+
+
+def make_data(num_rows: int) -> pd.DataFrame:
+    """Make processed data matching the example config."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "user_id": np.arange(num_rows).astype(str).astype(object),
+        "timestamp": pd.date_range("2020-01-01", periods=num_rows, freq="s"),
+        "name": "name",
+        "weight": rng.normal(75, 10, num_rows),
+        "height": rng.normal(180, 10, num_rows),
+        "age": rng.integers(18, 90, num_rows),
+        "bmi": rng.normal(23, 3, num_rows),
+        "life_expectancy": rng.integers(60, 100, num_rows),
+    })
+
+
+def main(num_rows: int) -> None:
+    config = read_config("tests/example_configs/example_config.yaml")
+    data = make_data(num_rows)
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        data.smart_pandas.load_config(config=config)
+        validated = data.smart_pandas.validate()
+        _ = validated.smart_pandas.model_features.to_numpy(), validated.smart_pandas.target.to_numpy()
+        uncached = time.perf_counter() - start
+
+        data.smart_pandas.cache_features(directory)
+        data.smart_pandas.cache_features(directory, data_key="benchmark")
+        start = time.perf_counter()
+        data.smart_pandas.load_config(config=config)
+        data.smart_pandas.cache_features(directory)
+        fingerprinted = time.perf_counter() - start
+
+        start = time.perf_counter()
+        data.smart_pandas.load_config(config=config)
+        data.smart_pandas.cache_features(directory, data_key="benchmark")
+        keyed = time.perf_counter() - start
+
+    print(f"{num_rows} rows")
+    print(f"validate and extract     {uncached * 1e3:8.1f} ms")
+    print(f"cache hit, fingerprinted {fingerprinted * 1e3:8.1f} ms")
+    print(f"cache hit, data_key      {keyed * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
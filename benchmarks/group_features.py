@@ -0,0 +1,72 @@
+"""
+Benchmark computing many per entity features with pandas groupby, and with the cached group index.
+
+Usage: python benchmarks/group_features.py [num_rows] [num_entities]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from smart_pandas.config.config_utils import read_config
+
+
+def make_data(num_rows: int, num_entities: int) -> pd.DataFrame:
+    """Make raw data matching the example config, with many rows per unique identifier in random time order."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "user_id": rng.integers(0, num_entities, num_rows).astype(str).astype(object),
+        "timestamp": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.permutation(num_rows), unit="s"),
+        "name": "name",
+        "weight": rng.normal(75, 10, num_rows),
+        "height": rng.normal(180, 10, num_rows),
+        "age": rng.integers(18, 90, num_rows),
+        "life_expectancy": rng.integers(60, 100, num_rows),
+    })
+
+
+def groupby_features(data: pd.DataFrame) -> dict[str, pd.Series]:
+    features = {}
+    for col in ["weight", "height", "age", "life_expectancy"]:
+        grouped = data.sort_values("timestamp").groupby("user_id")[col]
+        features[f"{col}_mean"] = grouped.transform("mean").reindex(data.index)
+        grouped = data.sort_values("timestamp").groupby("user_id")[col]
+        features[f"{col}_max"] = grouped.transform("max").reindex(data.index)
+        grouped = data.sort_values("timestamp").groupby("user_id")[col]
+        features[f"{col}_lag_1"] = grouped.shift(1).reindex(data.index)
+        grouped = data.sort_values("timestamp").groupby("user_id")[col]
+        features[f"{col}_lag_7"] = grouped.shift(7).reindex(data.index)
+        grouped = data.sort_values("timestamp").groupby("user_id")[col]
+        features[f"{col}_rolling_7"] = grouped.rolling(7).mean().droplevel(0).reindex(data.index)
+    return features
+
+
+def group_index_features(data: pd.DataFrame) -> dict[str, np.ndarray]:
+    features = {}
+    for col in ["weight", "height", "age", "life_expectancy"]:
+        index = data.smart_pandas.group_index()
+        features[f"{col}_mean"] = index.transform(data[col], "mean")
+        features[f"{col}_max"] = index.transform(data[col], "max")
+        features[f"{col}_lag_1"] = index.lag(data[col], 1)
+        features[f"{col}_lag_7"] = index.lag(data[col], 7)
+        features[f"{col}_rolling_7"] = index.rolling(data[col], 7, min_periods=7)
+    return features
+
+
+def main(num_rows: int, num_entities: int) -> None:
+    data = make_data(num_rows, num_entities)
+    data.smart_pandas.load_config(config=read_config("tests/example_configs/example_config.yaml"))
+
+    print(f"{num_rows} rows, {num_entities} entities, 20 features")
+    for label, func in [("groupby", groupby_features), ("group index", group_index_features)]:
+        start = time.perf_counter()
+        func(data)
+        print(f"{label:<12} {(time.perf_counter() - start) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+    )
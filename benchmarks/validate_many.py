@@ -0,0 +1,58 @@
+"""
+Benchmark validating many small DataFrames, one by one and with `validate_many`.
+
+Usage: python benchmarks/validate_many.py [num_frames] [rows_per_frame]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import smart_pandas
+from smart_pandas.config.config_utils import read_config
+
+
+def make_frames(num_frames: int, rows_per_frame: int) -> list[pd.DataFrame]:
+    """Make per-entity frames matching the example config, in the raw state."""
+    rng = np.random.default_rng(0)
+    frames = []
+    for entity in range(num_frames):
+        frames.append(pd.DataFrame({
+            "user_id": [f"{entity}-{i}" for i in range(rows_per_frame)],
+            "timestamp": pd.date_range("2020-01-01", periods=rows_per_frame, freq="D"),
+            "name": "name",
+            "weight": rng.normal(75, 10, rows_per_frame),
+            "height": rng.normal(180, 10, rows_per_frame),
+            "age": rng.integers(18, 90, rows_per_frame),
+            "life_expectancy": rng.integers(60, 100, rows_per_frame),
+        }))
+    return frames
+
+
+def main(num_frames: int, rows_per_frame: int) -> None:
+    config = read_config("tests/example_configs/example_config.yaml")
+
+    frames = make_frames(num_frames, rows_per_frame)
+    start = time.perf_counter()
+    for frame in frames:
+        frame.smart_pandas.load_config(config=config)
+        frame.smart_pandas.validate()
+    loop = time.perf_counter() - start
+
+    frames = make_frames(num_frames, rows_per_frame)
+    start = time.perf_counter()
+    result = smart_pandas.validate_many(frames, config)
+    batch = time.perf_counter() - start
+    assert result.is_valid
+
+    print(f"{num_frames} frames of {rows_per_frame} rows")
+    print(f"loop:          {num_frames / loop:,.0f} frames/s")
+    print(f"validate_many: {num_frames / batch:,.0f} frames/s")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 10,
+    )
@@ -0,0 +1,57 @@
+"""
+Benchmark the peak memory allocated while validating a DataFrame, with and without copying it.
+
+Usage: python benchmarks/validate_memory.py [num_rows]
+"""
+import sys
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from smart_pandas.config.config_utils import read_config
+
+
+def make_data(num_rows: int) -> pd.DataFrame:
+    """Make raw data matching the example config, with every column except `weight` already of the right dtype."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "user_id": np.arange(num_rows).astype(str).astype(object),
+        "timestamp": pd.date_range("2020-01-01", periods=num_rows, freq="s"),
+        "name": "name",
+        "weight": rng.integers(50, 100, num_rows),
+        "height": rng.normal(180, 10, num_rows),
+        "age": rng.integers(18, 90, num_rows),
+        "life_expectancy": rng.integers(60, 100, num_rows),
+    })
+
+
+def peak_allocated(data: pd.DataFrame, **kwargs) -> int:
+    """Peak bytes allocated by validating the data, on top of what was allocated before."""
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    data.smart_pandas.validate(**kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - baseline
+
+
+def main(num_rows: int) -> None:
+    config = read_config("tests/example_configs/example_config.yaml")
+    data = make_data(num_rows)
+    data.smart_pandas.load_config(config=config)
+    data_size = data.memory_usage(index=True, deep=False).sum()
+    # warm up the schema caches, so only the validation itself is measured
+    sample = data.head()
+    sample.smart_pandas.load_config(config=config)
+    sample.smart_pandas.validate()
+    sample.smart_pandas.validate(copy=False)
+
+    print(f"{num_rows} rows, {data_size / 1e6:.0f} MB of column buffers")
+    for label, kwargs in [("copy=True", {}), ("copy=False", {"copy": False})]:
+        peak = peak_allocated(data, **kwargs)
+        print(f"{label:<11} peak allocated {peak / 1e6:.0f} MB ({peak / data_size:.2f}x the data)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000)
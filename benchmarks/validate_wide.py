@@ -0,0 +1,62 @@
+"""
+Benchmark validating a wide DataFrame whose columns mostly have the right dtypes already.
+
+Usage: python benchmarks/validate_wide.py [num_columns] [num_rows]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from smart_pandas.config.data_config import DataConfig
+
+
+def make_config(num_columns: int) -> DataConfig:
+    """Make a config with the required columns plus `num_columns` float model features."""
+    columns = [
+        {"name": "id", "data_schema": {"dtype": "int"}, "tags": ["unique_identifier"]},
+        {"name": "timestamp", "data_schema": {"dtype": "datetime"}, "tags": ["row_timestamp"]},
+        {"name": "target", "data_schema": {"dtype": "float"}, "tags": ["target"]},
+    ]
+    columns += [
+        {"name": f"feature_{i}", "data_schema": {"dtype": "float"}, "tags": ["raw_feature", "model_feature"]}
+        for i in range(num_columns)
+    ]
+    return DataConfig(name="benchmark", columns=columns)
+
+
+def make_data(num_columns: int, num_rows: int) -> pd.DataFrame:
+    """Make processed data for the config, with every column of the right dtype except one integer feature."""
+    rng = np.random.default_rng(0)
+    features = pd.DataFrame(rng.normal(size=(num_rows, num_columns)), columns=[f"feature_{i}" for i in range(num_columns)])
+    features["feature_0"] = rng.integers(0, 100, num_rows)
+    return pd.concat([
+        pd.DataFrame({
+            "id": np.arange(num_rows),
+            "timestamp": pd.date_range("2020-01-01", periods=num_rows, freq="s"),
+            "target": rng.normal(size=num_rows),
+        }),
+        features,
+    ], axis=1)
+
+
+def main(num_columns: int, num_rows: int, repeats: int = 5) -> None:
+    config = make_config(num_columns)
+    data = make_data(num_columns, num_rows)
+    data.smart_pandas.load_config(config=config)
+    data.smart_pandas.validate(copy=False)
+
+    print(f"{num_columns} features, {num_rows} rows")
+    for label, kwargs in [("copy=True", {}), ("copy=False", {"copy": False})]:
+        start = time.perf_counter()
+        for _ in range(repeats):
+            data.smart_pandas.validate(**kwargs)
+        print(f"{label:<11} {(time.perf_counter() - start) / repeats * 1000:.0f} ms per validate")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100_000,
+    )
@@ -1,3 +1,4 @@
 from smart_pandas.smart_pandas import SmartPandas  # noqa: F401
 from smart_pandas.config.config_utils import read_config  # noqa: F401
 import pandas  # noqa: F401
+from smart_pandas.batch import concat, validate_many  # noqa: F401
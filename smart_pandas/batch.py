@@ -0,0 +1,261 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+import pandera as pa
+
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.state import State, StateError, StateName
+from smart_pandas.uniqueness import DuplicateKeyError, find_duplicate_positions
+
+# Built in pandera checks whose outcome for a row doesn't depend on the other rows
+_ROW_WISE_CHECKS = {
+    "equal_to",
+    "not_equal_to",
+    "greater_than",
+    "greater_than_or_equal_to",
+    "less_than",
+    "less_than_or_equal_to",
+    "in_range",
+    "isin",
+    "notin",
+    "str_matches",
+    "str_contains",
+    "str_startswith",
+    "str_endswith",
+    "str_length",
+}
+# Pandera validate arguments which only validate some of the rows
+_SAMPLING_KWARGS = ("head", "tail", "sample")
+
+
+def concat(
+    frames: list[pd.DataFrame],
+    ignore_index: bool = False,
+    check_unique_identifier: bool = True,
+) -> pd.DataFrame:
+    """
+    Concatenate validated DataFrames sharing a config and state, without re-validating the result.
+
+    Every input must have been validated with the same config, be in the same state and have the same columns in
+    the same order. Only the checks whose outcome can change on concatenation are run on the result: that the
+    column dtypes are unchanged and that columns which must be unique are still unique across the inputs. The result
+    is fully re-validated instead if the dtypes change, or the schema has checks which are not row-wise. All inputs
+    are combined in a single `pd.concat` call, so each output block is allocated once at its final size.
+
+    Parameters
+    ----------
+    frames : list[pd.DataFrame]
+        The validated DataFrames to concatenate
+    ignore_index : bool, default False
+        Whether to reset the index of the result, as in `pd.concat`
+    check_unique_identifier : bool, default True
+        Whether to check the unique identifier column for duplicates across the inputs, in addition to the columns
+        whose schema requires unique values
+
+    Returns
+    -------
+    pd.DataFrame
+        The concatenated DataFrame, initialised with the shared config and state and marked as validated
+
+    Raises
+    ------
+    ValueError
+        If no frames are given, or the frames are not validated with the same config and columns
+    StateError
+        If the frames are not in the same state
+    DuplicateKeyError
+        If a column which must be unique has duplicated values in the result
+    pa.errors.SchemaError
+        If the result is fully re-validated and fails its schema
+    """
+    frames = list(frames)
+    if not frames:
+        raise ValueError("No DataFrames to concatenate")
+
+    first = frames[0].smart_pandas
+    if first.config is None:
+        raise RuntimeError("SmartPandas not initialized. Call data.smart_pandas.load_config() first.")
+    for position, frame in enumerate(frames):
+        accessor = frame.smart_pandas
+        if accessor.config is None or accessor.config.fingerprint != first.config.fingerprint:
+            raise ValueError(f"DataFrame at position {position} does not share the config of the first DataFrame")
+        if accessor.state != first.state:
+            raise StateError(
+                f"DataFrame at position {position} is in state {accessor.state}, expected {first.state}"
+            )
+        if accessor.column_hash != first.column_hash:
+            raise ValueError(f"DataFrame at position {position} does not have the same columns as the first DataFrame")
+        if not accessor.is_validated:
+            raise ValueError(
+                f"DataFrame at position {position} has not been validated. Call data.smart_pandas.validate() first."
+            )
+
+    result = pd.concat(frames, ignore_index=ignore_index)
+    result.smart_pandas._inherit(first)
+
+    if not result.dtypes.equals(frames[0].dtypes) or not _is_row_wise(first.schema):
+        # e.g. categoricals with different categories are upcast, or a check reduces a whole column, so the result
+        # needs a full validation
+        result.smart_pandas.validate(inplace=True)
+        return result
+
+    unique_columns = [
+        column.name for column in first.config.columns
+        if column.name in result.columns and column.data_schema.unique
+    ]
+    if check_unique_identifier:
+        unique_columns.extend(col for col in first.config.unique_identifier if col not in unique_columns)
+    for column_name in unique_columns:
+        positions = find_duplicate_positions(result[column_name])
+        if len(positions):
+            raise DuplicateKeyError(column_name, positions)
+
+    result.smart_pandas._mark_validated()
+    return result
+
+
+class BatchValidationResult(NamedTuple):
+    """
+    Per-frame results of `validate_many`.
+
+    Parameters
+    ----------
+    frames: list[pd.DataFrame | None]
+        The validated DataFrame of each input, in input order, or None if it failed validation.
+    errors: dict[int, Exception]
+        The validation error of each failed input, keyed by input position.
+    """
+
+    frames: list[pd.DataFrame | None]
+    errors: dict[int, Exception]
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+
+def _is_row_wise(schema: pa.DataFrameSchema) -> bool:
+    """Whether the schema's outcome for a row is independent of the other rows, so frames can be validated together."""
+    if schema.checks or schema.unique:
+        return False
+    for column_schema in schema.columns.values():
+        if column_schema.unique:
+            return False
+        for check in column_schema.checks:
+            if check.groupby is not None or not (check.element_wise or check.name in _ROW_WISE_CHECKS):
+                return False
+    return True
+
+
+def _validate_frame(frame: pd.DataFrame, config: DataConfig, **kwargs: Any) -> pd.DataFrame:
+    """Validate a single DataFrame, as a user would without `validate_many`."""
+    frame.smart_pandas.load_config(config=config)
+    return frame.smart_pandas.validate(**kwargs)
+
+
+def _validate_combined(frames: list[pd.DataFrame], config: DataConfig, **kwargs: Any) -> list[pd.DataFrame] | None:
+    """
+    Validate frames with the same layout as one concatenated DataFrame, then split the result.
+
+    Returns None if the combined validation is not applicable to the schema or fails, in which case the frames
+    should be validated one by one to attribute the errors.
+    """
+    # the state only depends on the columns, and data in these states can't be validated, so each frame records
+    # its own error
+    if State.from_data(data=frames[0], config=config).name in (StateName.UNKNOWN, StateName.CORRUPTED):
+        return None
+    combined = pd.concat(frames)
+    accessor = combined.smart_pandas
+    accessor.load_config(config=config)
+    if not _is_row_wise(accessor.schema):
+        return None
+    try:
+        accessor.validate(inplace=True, **kwargs)
+    except (pa.errors.SchemaError, pa.errors.SchemaErrors):
+        return None
+
+    bounds = np.cumsum([0] + [len(frame) for frame in frames])
+    results = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        result = combined.iloc[lo:hi]
+        result.smart_pandas._inherit(accessor)
+        result.smart_pandas._mark_validated()
+        results.append(result)
+    return results
+
+
+def validate_many(
+    frames: list[pd.DataFrame],
+    config: DataConfig,
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> BatchValidationResult:
+    """
+    Validate many DataFrames against the same config, amortising the fixed cost of validation across them.
+
+    Frames are grouped by their columns and dtypes. The state of each group is inferred once, and the frames of a
+    group are concatenated and validated in a single pandera call, then split back into one result per frame. If
+    the schema has checks which depend on other rows, e.g. unique columns, or the combined validation fails, the
+    frames of the group are validated one by one in a thread pool instead, so each error is attributed to its frame.
+
+    Parameters
+    ----------
+    frames : list[pd.DataFrame]
+        The DataFrames to validate
+    config : DataConfig
+        The config to validate against
+    max_workers : int, optional
+        Number of threads validating frames one by one, frames are validated serially if 1
+    **kwargs
+        Additional keyword arguments to pass to the Pandera schema validate method. With head, tail or sample,
+        frames are validated one by one, so each frame's own rows are sampled.
+
+    Returns
+    -------
+    BatchValidationResult
+        The validated DataFrames and the errors of the frames which failed. Results of a combined validation are
+        slices of the combined DataFrame, initialised with the config and state and marked as validated.
+
+    Raises
+    ------
+    ValueError
+        If inplace is passed
+    """
+    if "inplace" in kwargs:
+        raise ValueError("validate_many returns the validated DataFrames, inplace is not supported")
+    # a sample of the combined frame says nothing about the rows of each frame which were not sampled
+    combine = all(kwargs.get(name) is None for name in _SAMPLING_KWARGS)
+
+    frames = list(frames)
+    groups: dict[tuple, list[int]] = {}
+    for position, frame in enumerate(frames):
+        groups.setdefault((tuple(frame.columns), tuple(frame.dtypes)), []).append(position)
+
+    results: list[pd.DataFrame | None] = [None] * len(frames)
+    remaining = []
+    for positions in groups.values():
+        combined = None
+        if combine and len(positions) > 1:
+            combined = _validate_combined([frames[i] for i in positions], config, **kwargs)
+        if combined is None:
+            remaining.extend(positions)
+            continue
+        for position, result in zip(positions, combined):
+            results[position] = result
+
+    def validate_position(position: int) -> Exception | None:
+        try:
+            results[position] = _validate_frame(frames[position], config, **kwargs)
+        except Exception as e:
+            return e
+        return None
+
+    if max_workers == 1 or len(remaining) <= 1:
+        outcomes = list(map(validate_position, remaining))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = list(executor.map(validate_position, remaining))
+    errors = {position: error for position, error in zip(remaining, outcomes) if error is not None}
+    return BatchValidationResult(frames=results, errors=errors)
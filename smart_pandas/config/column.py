@@ -1,4 +1,9 @@
+import copy
+from functools import lru_cache
+from typing import Any, Hashable
+
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator, field_serializer, ValidationError
+import pandas as pd
 import pandera as pa
 
 from smart_pandas.config.tag import TAGS
@@ -6,6 +11,56 @@ from smart_pandas.config.tag_set import TagSet
 from smart_pandas.config.validation_exceptions import TagCompatibilityError
 
 
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert a schema definition to a hashable key.
+
+    Only plain data, as read from a config file, is accepted, raising TypeError otherwise. Objects such as checks
+    can compare equal while behaving differently, e.g. lambdas with different closures, so are never shared.
+    """
+    if isinstance(value, dict):
+        return ("__dict__", *((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return ("__list__", *(_freeze(item) for item in value))
+    if value is not None and not isinstance(value, (str, int, float, bool)):
+        raise TypeError(f"Cannot intern a schema definition containing {type(value).__name__}")
+    return value
+
+
+def _thaw(value: Hashable) -> Any:
+    """Convert a key made by `_freeze` back to the schema definition."""
+    if isinstance(value, tuple) and value and value[0] == "__dict__":
+        return {key: _thaw(item) for key, item in value[1:]}
+    if isinstance(value, tuple) and value and value[0] == "__list__":
+        return [_thaw(item) for item in value[1:]]
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _build_pandera_column(frozen_schema: Hashable) -> pa.Column:
+    """Build a pandera column, used as the template of every column with the same schema definition."""
+    return pa.Column(**_thaw(frozen_schema))
+
+
+def _copy_pandera_column(column: pa.Column) -> pa.Column:
+    """Copy a template column, which is much cheaper than building a pandera column from its definition."""
+    column = copy.copy(column)
+    column.checks = list(column.checks)
+    column.parsers = list(column.parsers)
+    return column
+
+
+@lru_cache(maxsize=4096)
+def _build_tag_set(tags: tuple[str, ...]) -> TagSet:
+    """Build and validate a tag set, used as the template of every column with the same tags."""
+    return TagSet(tags=list(tags))
+
+
+def _copy_tag_set(tag_set: TagSet) -> TagSet:
+    """Copy a template tag set without validating it again."""
+    return tag_set.model_copy(update={"tags": list(tag_set.tags)})
+
+
 class Column(BaseModel):
     """Class to represent a column in a dataframe.
 
@@ -30,13 +85,18 @@ class Column(BaseModel):
     @field_validator("data_schema", mode="before")
     def parse_pandera_column(cls, v):
         if isinstance(v, dict):
-            return pa.Column(**v)
+            try:
+                return _copy_pandera_column(_build_pandera_column(_freeze(v)))
+            except TypeError:
+                return pa.Column(**v)
         return v
 
     @field_validator("tags", mode="before")
     def parse_tags(cls, v, values):
         if isinstance(v, list):
             try:
+                if all(isinstance(tag, str) for tag in v):
+                    return _copy_tag_set(_build_tag_set(tuple(v)))
                 return TagSet(tags=v)
             except ValidationError as e:
                 error = e.errors()[0]
@@ -50,12 +110,15 @@ class Column(BaseModel):
     @model_validator(mode='after')
     def set_tag_attributes(self):
         """Set tag attributes on the column for easy access."""
-        for tag_name in TAGS.keys():
-            setattr(self, tag_name, any(tag == tag_name for tag in self.tags))
+        tag_names = {tag.name for tag in self.tags}
+        # set the extra fields directly, pydantic's __setattr__ is slow when repeated for many columns
+        self.__pydantic_extra__.update({tag_name: tag_name in tag_names for tag_name in TAGS})
         return self
 
     @field_serializer("data_schema")
     def serialize_data_schema(self, data_schema: pa.Column) -> dict:
         dict_schema = data_schema.properties
-        dict_schema["dtype"] = dict_schema["dtype"].type.name
+        dtype = dict_schema["dtype"].type
+        # the name of a pandas string dtype doesn't include its storage, e.g. string[pyarrow]
+        dict_schema["dtype"] = f"string[{dtype.storage}]" if isinstance(dtype, pd.StringDtype) else dtype.name
         return dict_schema
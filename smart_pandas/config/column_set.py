@@ -18,31 +18,28 @@ class ColumnSet(BaseModel):
 
     @field_validator("columns")
     @classmethod
-    def validate_column_set_length(cls, columns: List[Column]) -> List[Column]:
+    def validate_columns(cls, columns: List[Column]) -> List[Column]:
+        """Check the column set is non-empty, within the tag count limits and has unique names, in a single pass."""
         if len(columns) == 0:
             raise EmptyColumnSetError()
-        return columns
 
-    @field_validator("columns")
-    @classmethod
-    def validate_tag_count_limits(cls, columns: List[Column]) -> List[Column]:
-        tag_collection = [column.tags for column in columns]
-        flattened_tag_collection = [
-            tag for tags in tag_collection for tag in tags
-        ]
-        for tag, counter in Counter(flattened_tag_collection).items():
+        tags = {}
+        tag_counts = Counter()
+        name_counts = Counter()
+        for column in columns:
+            name_counts[column.name] += 1
+            for tag in column.tags:
+                tags.setdefault(tag.name, tag)
+                tag_counts[tag.name] += 1
+
+        for tag_name, counter in tag_counts.items():
+            tag = tags[tag_name]
             if tag.config_limit[0] is not None and counter < tag.config_limit[0]:
                 raise TagLimitExceededError(tag.name, tag.config_limit[0], counter)
             if tag.config_limit[1] is not None and counter > tag.config_limit[1]:
                 raise TagLimitExceededError(tag.name, tag.config_limit[1], counter)
 
-        return columns
-
-    @field_validator("columns")
-    @classmethod
-    def validate_unique_column_names(cls, columns: List[Column]) -> List[Column]:
-        column_names = Counter([column.name for column in columns])
-        duplicate_columns = [column for column, count in column_names.items() if count > 1]
+        duplicate_columns = [column for column, count in name_counts.items() if count > 1]
         if duplicate_columns:
             raise DuplicateColumnError(duplicate_columns)
         return columns
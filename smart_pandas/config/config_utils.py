@@ -1,10 +1,17 @@
+import json
 import yaml
 from pathlib import Path
 from smart_pandas.config.data_config import DataConfig
+from smart_pandas.executor import ValidationExecutor, get_default_executor
+
+# The LibYAML based loader is many times faster for large configs, fall back to the pure Python one if unavailable
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def read_yaml(path: str) -> dict:
     """Read YAML file with proper error handling.
+
+    Files with a `.json` suffix are parsed with the much faster JSON parser, JSON being a subset of YAML.
     
     Parameters
     ----------
@@ -29,8 +36,10 @@ def read_yaml(path: str) -> dict:
     
     try:
         with open(file_path) as stream:
-            return yaml.safe_load(stream)
-    except yaml.YAMLError as e:
+            if file_path.suffix == ".json":
+                return json.load(stream)
+            return yaml.load(stream, Loader=_YAML_LOADER)
+    except (yaml.YAMLError, json.JSONDecodeError) as e:
         raise yaml.YAMLError(f"Error parsing YAML file {path}: {e}")
 
 
@@ -67,6 +76,25 @@ def read_config(path: str) -> DataConfig:
         raise ValueError(f"Error creating DataConfig from {path}: {e}")
 
 
+async def aread_config(path: str, executor: ValidationExecutor | None = None) -> DataConfig:
+    """Read and parse a DataConfig from a YAML file without blocking the running event loop.
+
+    Parameters
+    ----------
+    path : str
+        Path to the configuration YAML file
+    executor : ValidationExecutor, optional
+        Executor to run the blocking file read and parsing in, defaults to the shared default executor
+
+    Returns
+    -------
+    DataConfig
+        Parsed configuration object
+    """
+    executor = executor or get_default_executor()
+    return await executor.run(read_config, path)
+
+
 def validate_config_file(path: str) -> bool:
     """Validate a config file without loading it completely.
     
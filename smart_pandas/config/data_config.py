@@ -1,7 +1,38 @@
+import hashlib
+from functools import cached_property
+from types import CodeType
+from typing import Any, Literal
+
+import pandera as pa
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
 from smart_pandas.config.column_set import ColumnSet
 from smart_pandas.config.tag import TAGS
 
+
+def _code_identity(code: CodeType) -> tuple:
+    """Identify a function's code by its bytecode, constants and names, which are stable between processes."""
+    consts = tuple(_code_identity(const) if isinstance(const, CodeType) else repr(const) for const in code.co_consts)
+    return code.co_code.hex(), consts, code.co_names
+
+
+def _fingerprint_fallback(value: Any) -> Any:
+    """Serialise values pydantic can't, identifying custom checks by their function rather than their repr."""
+    if isinstance(value, pa.Check):
+        function = value._check_fn
+        code = getattr(function, "__code__", None)
+        return {
+            "check": repr(value),
+            "function": getattr(function, "__qualname__", repr(function)),
+            "code": _code_identity(code) if code is not None else None,
+            "closure": [repr(cell.cell_contents) for cell in getattr(function, "__closure__", None) or ()],
+            "defaults": repr(getattr(function, "__defaults__", None)),
+            "kwargs": repr(value._check_kwargs),
+            "statistics": repr(value.statistics),
+            "options": [value.element_wise, value.ignore_na, repr(value.groupby)],
+        }
+    return repr(value)
+
+
 class DataConfig(BaseModel):
     """
     Config object for a dataset.
@@ -14,10 +45,14 @@ class DataConfig(BaseModel):
         The name of the dataset.
     columns: ColumnSet
         The column set of the dataset.
+    dtype_backend: Literal["numpy", "pyarrow"] = "numpy"
+        The backend of the column dtypes in the schema. With "pyarrow", NumPy style dtypes such as int or str are
+        validated as their Arrow backed equivalents, e.g. int64[pyarrow] or string[pyarrow].
     """
     model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
     name: str
     columns: ColumnSet
+    dtype_backend: Literal["numpy", "pyarrow"] = "numpy"
 
     @field_validator("columns", mode="before")
     def parse_column_set(cls, v):
@@ -27,9 +62,14 @@ class DataConfig(BaseModel):
 
     @model_validator(mode="after")
     def set_data_attributes(self):
-        """Set the data attributes dynamically based on the column set."""
+        """Set the data attributes dynamically based on the column set, in a single pass over the columns."""
+        columns_by_tag = {tag_name: [] for tag_name in TAGS}
+        for column in self.columns:
+            for tag in column.tags:
+                if tag.name in columns_by_tag:
+                    columns_by_tag[tag.name].append(column.name)
         for tag in TAGS.values():
-            setattr(self, tag.data_attribute_name, self._get_columns_by_tag(tag.name))
+            setattr(self, tag.data_attribute_name, columns_by_tag[tag.name])
         return self
 
     def _get_columns_by_tag(self, tag_name: str) -> list[str]:
@@ -38,3 +78,19 @@ class DataConfig(BaseModel):
             column.name for column in self.columns
             if tag_name in column.tags
         ]
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Content hash of the config, identifying configs with the same name and column definitions.
+
+        Custom checks are identified by the code, closure and defaults of their function, so configs whose checks
+        differ only in their function get different fingerprints. The fingerprint is cached, see
+        `_reset_fingerprint` for configs edited in place.
+        """
+        serialized = self.model_dump_json(include={"name", "columns", "dtype_backend"}, fallback=_fingerprint_fallback)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _reset_fingerprint(self) -> None:
+        """Drop the cached fingerprint, so edits made to the columns in place are picked up by the next lookup."""
+        self.__dict__.pop("fingerprint", None)
@@ -33,7 +33,7 @@ class Tag(BaseModel):
         return f"Tag(name='{self.name}')"
 
     def __hash__(self):
-        return hash(repr(self))
+        return hash(self.name)
 
 
 def get_compatible_tags(tag_name: str, tag_pairs: list[tuple[str, str]]) -> set[str]:
@@ -29,3 +29,6 @@ class TagSet(BaseModel):
     def __iter__(self):
         for tag in self.tags:
             yield tag
+
+    def __contains__(self, tag_name: str) -> bool:
+        return any(tag.name == tag_name for tag in self.tags)
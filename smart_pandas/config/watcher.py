@@ -0,0 +1,242 @@
+import threading
+import time
+import warnings
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from smart_pandas.config.config_utils import read_config
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.config.tag import TAGS
+from smart_pandas.registry import migrate_schemas
+from smart_pandas.state import State
+
+
+class ConfigDiff(NamedTuple):
+    """
+    Structural differences between two versions of a DataConfig.
+
+    Parameters
+    ----------
+    added_columns: list[str]
+        Columns only in the new config.
+    removed_columns: list[str]
+        Columns only in the old config.
+    retagged_columns: list[str]
+        Columns in both configs with different tags.
+    schema_changed_columns: list[str]
+        Columns in both configs with a different data schema, or every shared column if the dtype backend changed.
+    changed_data_attributes: list[str]
+        Tag data attributes, e.g. "model_features", whose columns differ between the configs.
+    """
+
+    added_columns: list[str]
+    removed_columns: list[str]
+    retagged_columns: list[str]
+    schema_changed_columns: list[str]
+    changed_data_attributes: list[str]
+
+    @property
+    def is_empty(self) -> bool:
+        return not any(self)
+
+    @property
+    def affects_state_inference(self) -> bool:
+        """Whether the state inferred for the same data may differ between the configs."""
+        return bool(self.changed_data_attributes)
+
+    def affects_state(self, config: DataConfig, state: State) -> bool:
+        """
+        Whether the validation schema of a state differs between the configs.
+
+        Parameters
+        ----------
+        config : DataConfig
+            Either version of the config
+        state : State
+            The state of the schema
+
+        Returns
+        -------
+        bool
+            True if the columns of the state, or the data schema of any of them, changed
+        """
+        incompatibilities = state.name.incompatibilities + state.ml_stage.incompatibilities
+        if any(name not in incompatibilities for name in self.changed_data_attributes):
+            return True
+        schema_changed = set(self.schema_changed_columns)
+        return any(col in schema_changed for col in state.get_state_columns(config))
+
+
+def diff_configs(old: DataConfig, new: DataConfig) -> ConfigDiff:
+    """
+    Compute the structural differences between two versions of a config.
+
+    Parameters
+    ----------
+    old : DataConfig
+        The previous version of the config
+    new : DataConfig
+        The new version of the config
+
+    Returns
+    -------
+    ConfigDiff
+        The differences, empty if the configs define the same columns, tags and schemas
+    """
+    old_columns = {column.name: column for column in old.columns}
+    new_columns = {column.name: column for column in new.columns}
+    shared = [name for name in new_columns if name in old_columns]
+    backend_changed = old.dtype_backend != new.dtype_backend
+
+    return ConfigDiff(
+        added_columns=[name for name in new_columns if name not in old_columns],
+        removed_columns=[name for name in old_columns if name not in new_columns],
+        retagged_columns=[
+            name for name in shared
+            if {tag.name for tag in old_columns[name].tags} != {tag.name for tag in new_columns[name].tags}
+        ],
+        schema_changed_columns=[
+            name for name in shared
+            if backend_changed or old_columns[name].data_schema != new_columns[name].data_schema
+        ],
+        changed_data_attributes=[
+            tag.data_attribute_name for tag in TAGS.values()
+            if getattr(old, tag.data_attribute_name) != getattr(new, tag.data_attribute_name)
+        ],
+    )
+
+
+class ConfigWatcher:
+    """
+    Config loaded from a YAML file, which is reloaded when the file changes.
+
+    The file's modification time is checked at most once per `check_interval` when the config is accessed. On a
+    change, cached schemas of states the change doesn't affect are carried over to the new config, so only the
+    affected schemas are rebuilt. Accessors loaded with `load_config(config_path, watch=True)` switch to the new
+    config on their next access. If the new file can't be read, a warning is raised and the previous config is
+    kept.
+    """
+
+    def __init__(self, path: str, check_interval: float = 1.0):
+        """
+        Load the config and start watching its file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the configuration YAML file
+        check_interval : float, default 1.0
+            Minimum number of seconds between checks of the file, 0 checks on every access
+        """
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._config = read_config(str(self.path))
+        self._file_key = self._get_file_key()
+        self._next_check = time.monotonic() + check_interval
+        self._diffs: dict[tuple[str, str], ConfigDiff] = {}
+        self._callbacks: list[Callable[[DataConfig, DataConfig, ConfigDiff], None]] = []
+
+    def _get_file_key(self) -> tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @property
+    def config(self) -> DataConfig:
+        """The current config, reloading it first if the file has changed and is due to be checked."""
+        if time.monotonic() >= self._next_check:
+            self.check()
+        return self._config
+
+    def check(self) -> bool:
+        """
+        Reload the config if its file has changed.
+
+        Returns
+        -------
+        bool
+            Whether the config changed
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                # e.g. the file is briefly missing while an editor replaces it
+                file_key = self._get_file_key()
+                if file_key == self._file_key:
+                    return False
+                self._file_key = file_key
+                new = read_config(str(self.path))
+            except Exception as e:
+                warnings.warn(
+                    f"Failed to reload config from {self.path}, keeping the previous config: {e}", UserWarning
+                )
+                return False
+
+            old = self._config
+            if new.fingerprint == old.fingerprint:
+                return False
+            diff = diff_configs(old, new)
+            migrate_schemas(old, new, diff)
+            self._diffs = {(old.fingerprint, new.fingerprint): diff}
+            self._config = new
+
+        for callback in self._callbacks:
+            callback(old, new, diff)
+        return True
+
+    def diff_from(self, config: DataConfig) -> ConfigDiff:
+        """
+        Get the differences from an older version of the config to the current one.
+
+        Parameters
+        ----------
+        config : DataConfig
+            A previous version of the config
+
+        Returns
+        -------
+        ConfigDiff
+            The differences, computed once per version
+        """
+        current = self._config
+        key = (config.fingerprint, current.fingerprint)
+        diff = self._diffs.get(key)
+        if diff is None:
+            diff = self._diffs.setdefault(key, diff_configs(config, current))
+        return diff
+
+    def on_change(self, callback: Callable[[DataConfig, DataConfig, ConfigDiff], None]) -> None:
+        """Register a function called with the old config, new config and their diff after each reload."""
+        self._callbacks.append(callback)
+
+    def __repr__(self) -> str:
+        return f"ConfigWatcher(path='{self.path}', config='{self._config.name}')"
+
+
+# Process wide watchers, so every accessor watching a file shares one watcher and one copy of the config
+_WATCHERS: dict[Path, ConfigWatcher] = {}
+_lock = threading.Lock()
+
+
+def get_watcher(path: str) -> ConfigWatcher:
+    """
+    Get the shared watcher of a config file, creating it on first use.
+
+    Parameters
+    ----------
+    path : str
+        Path to the configuration YAML file
+
+    Returns
+    -------
+    ConfigWatcher
+        The watcher of the file
+    """
+    resolved = Path(path).resolve()
+    watcher = _WATCHERS.get(resolved)
+    if watcher is None:
+        with _lock:
+            watcher = _WATCHERS.get(resolved)
+            if watcher is None:
+                watcher = _WATCHERS[resolved] = ConfigWatcher(str(resolved))
+    return watcher
@@ -0,0 +1,295 @@
+import glob
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Iterator
+
+import pandas as pd
+
+from smart_pandas.config.config_utils import read_config
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.smart_pandas import DATA_ATTRIBUTES
+from smart_pandas.state import State
+
+
+def _import_pyarrow_dataset():
+    """Import pyarrow.dataset, which is an optional dependency."""
+    try:
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for SmartDataset, install it with `pip install smart-pandas[arrow]`"
+        ) from e
+    return pyarrow.dataset
+
+
+class ColumnProjection:
+    """
+    Lazily evaluated selection of columns from a SmartDataset, optionally filtered on the row timestamp.
+
+    No data is read until the projection is materialised with `to_pandas` or `iter_batches`. Filters are pushed
+    down to the parquet reader, so partitions and row groups outside the time range are skipped.
+    """
+
+    def __init__(self, dataset: "SmartDataset", columns: list[str], filter: Any = None):
+        """
+        Initialize the projection.
+
+        Parameters
+        ----------
+        dataset : SmartDataset
+            The dataset to project
+        columns : list[str]
+            The columns to select
+        filter : pyarrow.dataset.Expression, optional
+            Row filter to push down to the reader
+        """
+        self.dataset = dataset
+        self.columns = columns
+        self.filter = filter
+
+    def between(self, start=None, end=None) -> "ColumnProjection":
+        """
+        Filter the rows to a row timestamp range.
+
+        Parameters
+        ----------
+        start : timestamp-like, optional
+            Inclusive lower bound, unbounded if None
+        end : timestamp-like, optional
+            Exclusive upper bound, unbounded if None
+
+        Returns
+        -------
+        ColumnProjection
+            A new projection with the filter added
+        """
+        time_filter = self.dataset.time_filter(start=start, end=end)
+        if time_filter is None:
+            return self
+        if self.filter is not None:
+            time_filter = self.filter & time_filter
+        return ColumnProjection(self.dataset, self.columns, time_filter)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Read the projected columns into a DataFrame."""
+        table = self.dataset.arrow_dataset.to_table(columns=self.columns, filter=self.filter)
+        return self.dataset._table_to_pandas(table)
+
+    def iter_batches(self, batch_size: int = 131_072) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the projected columns in record batches.
+
+        Parameters
+        ----------
+        batch_size : int, default 131_072
+            The maximum number of rows per batch
+
+        Yields
+        ------
+        pd.DataFrame
+            The rows of each batch
+        """
+        for batch in self.dataset.arrow_dataset.to_batches(
+            columns=self.columns, filter=self.filter, batch_size=batch_size
+        ):
+            yield self.dataset._table_to_pandas(batch)
+
+    def __repr__(self) -> str:
+        return f"ColumnProjection(columns={self.columns}, filter={self.filter})"
+
+
+class SmartDataset:
+    """
+    Out-of-core dataset of parquet files, with the semantic column groups and state of a SmartPandas DataFrame.
+
+    The state is inferred from the file schemas without reading any data. Partition fields which are not columns
+    of the config, e.g. `date` in a `date=2020-01-01/` directory layout, are left out of the data. Tag data
+    attributes, eg:
+    `dataset.model_features`, return lazily evaluated `ColumnProjection` objects rather than DataFrames, or None
+    if the attribute is incompatible with the state, as for the accessor.
+    """
+
+    def __init__(
+        self,
+        source: str | list[str],
+        config_path: str | None = None,
+        config: DataConfig | None = None,
+        partitioning: str | None = "hive",
+    ):
+        """
+        Initialize the dataset.
+
+        Parameters
+        ----------
+        source : str or list[str]
+            A directory of parquet files, a glob pattern, or a list of file paths
+        config_path : str, optional
+            Path to the configuration YAML file
+        config : DataConfig, optional
+            DataConfig object to use directly
+        partitioning : str, optional, default "hive"
+            The partitioning scheme of the directory, passed to `pyarrow.dataset.dataset`
+
+        Raises
+        ------
+        ValueError
+            If neither config nor config_path is provided
+        """
+        if config is None and config_path is None:
+            raise ValueError("Either config or config_path must be provided")
+        dataset = _import_pyarrow_dataset()
+
+        if isinstance(source, str) and glob.has_magic(source):
+            source = sorted(glob.glob(source))
+        self.config = config if config is not None else read_config(config_path)
+        self.name = self.config.name
+        self.arrow_dataset = dataset.dataset(source, format="parquet", partitioning=partitioning)
+        partitioning = self.arrow_dataset.partitioning
+        config_columns = {column.name for column in self.config.columns}
+        # partition fields outside the config can still be filtered on, but are not read as columns, as the strict
+        # schema would reject them
+        self.partition_columns = [
+            name for name in (partitioning.schema.names if partitioning is not None else [])
+            if name not in config_columns
+        ]
+        self.columns = [name for name in self.arrow_dataset.schema.names if name not in self.partition_columns]
+        self.state = State.from_columns(self.columns, self.config)
+
+    def _table_to_pandas(self, table) -> pd.DataFrame:
+        """Convert an Arrow table or record batch to pandas, keeping Arrow dtypes for the pyarrow dtype backend."""
+        if self.config.dtype_backend == "pyarrow":
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        return table.to_pandas()
+
+    def time_filter(self, start=None, end=None) -> Any:
+        """
+        Build a filter expression selecting a row timestamp range.
+
+        Parameters
+        ----------
+        start : timestamp-like, optional
+            Inclusive lower bound, unbounded if None
+        end : timestamp-like, optional
+            Exclusive upper bound, unbounded if None
+
+        Returns
+        -------
+        pyarrow.dataset.Expression or None
+            The filter, or None if both bounds are None
+        """
+        import pyarrow
+
+        dataset = _import_pyarrow_dataset()
+        # the row_timestamp tag is limited to exactly one column
+        timestamp_column = self.config.row_timestamp[0]
+        timestamp_type = self.arrow_dataset.schema.field(timestamp_column).type
+        expression = None
+        if start is not None:
+            expression = dataset.field(timestamp_column) >= pyarrow.scalar(pd.Timestamp(start), type=timestamp_type)
+        if end is not None:
+            end_expression = dataset.field(timestamp_column) < pyarrow.scalar(pd.Timestamp(end), type=timestamp_type)
+            expression = end_expression if expression is None else expression & end_expression
+        return expression
+
+    def select(self, columns: list[str]) -> ColumnProjection:
+        """Lazily select columns of the dataset."""
+        return ColumnProjection(self, list(columns))
+
+    def to_pandas(self, start=None, end=None) -> pd.DataFrame:
+        """
+        Read the dataset into a DataFrame with an initialized SmartPandas accessor.
+
+        Parameters
+        ----------
+        start : timestamp-like, optional
+            Inclusive lower bound on the row timestamp
+        end : timestamp-like, optional
+            Exclusive upper bound on the row timestamp
+
+        Returns
+        -------
+        pd.DataFrame
+            The data
+        """
+        data = self.select(self.columns).between(start=start, end=end).to_pandas()
+        data.smart_pandas.load_config(config=self.config)
+        return data
+
+    def _read_fragment(self, fragment) -> pd.DataFrame:
+        """Read a single file, including its partition columns defined in the config, with an initialized accessor."""
+        data = self._table_to_pandas(fragment.to_table(schema=self.arrow_dataset.schema, columns=self.columns))
+        data.smart_pandas.load_config(config=self.config)
+        return data
+
+    def iter_partitions(self, max_workers: int | None = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the files of the dataset as DataFrames with initialized accessors.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of threads reading files ahead of the consumer, which also bounds the number of files held in
+            memory before they are yielded. Files are read one at a time if 1, defaults to the default number of
+            threads of a `ThreadPoolExecutor`.
+
+        Yields
+        ------
+        pd.DataFrame
+            The data of each file, in file order
+        """
+        fragments = list(self.arrow_dataset.get_fragments())
+        if max_workers == 1:
+            yield from map(self._read_fragment, fragments)
+            return
+        max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # only submit a file once an earlier one is consumed, so the reads can't run ahead of the consumer
+            in_flight = deque()
+            remaining = iter(fragments)
+            for fragment in islice(remaining, max_workers):
+                in_flight.append(executor.submit(self._read_fragment, fragment))
+            while in_flight:
+                data = in_flight.popleft().result()
+                for fragment in islice(remaining, 1):
+                    in_flight.append(executor.submit(self._read_fragment, fragment))
+                yield data
+
+    def _validate_fragment(self, fragment) -> Exception | None:
+        """Validate a single file, returning the error if it fails."""
+        try:
+            self._read_fragment(fragment).smart_pandas.validate(inplace=True)
+        except Exception as e:
+            return e
+        return None
+
+    def validate(self, max_workers: int | None = None) -> dict[str, Exception]:
+        """
+        Validate every file of the dataset in parallel.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of threads validating files
+
+        Returns
+        -------
+        dict[str, Exception]
+            The validation error of each file which failed, keyed by file path. Empty if every file is valid.
+        """
+        fragments = list(self.arrow_dataset.get_fragments())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            errors = executor.map(self._validate_fragment, fragments)
+            return {fragment.path: error for fragment, error in zip(fragments, errors) if error is not None}
+
+    def __getattr__(self, name: str) -> ColumnProjection | None:
+        """Get tag data attributes as lazy column projections, based on the config and state."""
+        if name in DATA_ATTRIBUTES:
+            if name in self.state.name.incompatibilities or name in self.state.ml_stage.incompatibilities:
+                return None
+            return self.select(getattr(self.config, name))
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __repr__(self) -> str:
+        return f"SmartDataset(name='{self.name}', state={self.state}, files={len(self.arrow_dataset.files)})"
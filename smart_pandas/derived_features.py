@@ -0,0 +1,207 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from graphlib import CycleError, TopologicalSorter
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from smart_pandas.config.data_config import DataConfig
+
+
+class DerivedFeature:
+    """
+    A vectorised function computing a derived feature column from its input columns.
+
+    Parameters
+    ----------
+    name: str
+        The name of the derived feature column.
+    inputs: list[str]
+        The names of the input columns, passed to the function as Series in this order.
+    func: Callable[..., array-like]
+        The function computing the feature, returning a value per row.
+    """
+
+    def __init__(self, name: str, inputs: list[str], func: Callable):
+        self.name = name
+        self.inputs = inputs
+        self.func = func
+
+    def __repr__(self) -> str:
+        return f"DerivedFeature(name='{self.name}', inputs={self.inputs})"
+
+
+class DerivedFeatureEngine:
+    """
+    Engine for computing the derived features of a config from registered vectorised functions.
+
+    Features are computed in dependency order, with independent features computed in parallel. All new columns are
+    added to the data in a single operation, so the resulting DataFrame's state changes once. Results are cached
+    by the content of their input columns, so recomputing a feature on unchanged inputs is free.
+    """
+
+    def __init__(self, config: DataConfig, max_workers: int | None = None, cache_size: int = 128):
+        """
+        Initialize the engine.
+
+        Parameters
+        ----------
+        config : DataConfig
+            The config defining the derived feature columns
+        max_workers : int, optional
+            Number of threads for computing independent features, features are computed serially if 1
+        cache_size : int, default 128
+            Maximum number of cached feature results, 0 disables caching
+        """
+        self.config = config
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.features: dict[str, DerivedFeature] = {}
+        self._cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def register(self, name: str, inputs: list[str], func: Callable | None = None):
+        """
+        Register the function computing a derived feature, can also be used as a decorator.
+
+        Parameters
+        ----------
+        name : str
+            The derived feature column, must be tagged `derived_feature` in the config
+        inputs : list[str]
+            The input columns, must be defined in the config
+        func : Callable, optional
+            The vectorised function, called with the input columns as Series in order. Registering a new function
+            for a feature clears the cache.
+
+        Raises
+        ------
+        ValueError
+            If the feature or inputs are not defined in the config
+        """
+        if func is None:
+            return lambda func: self.register(name, inputs, func) or func
+
+        if name not in self.config.derived_features:
+            raise ValueError(f"'{name}' is not a derived feature in config {self.config.name}")
+        config_columns = {column.name for column in self.config.columns}
+        unknown_inputs = [col for col in inputs if col not in config_columns]
+        if unknown_inputs:
+            raise ValueError(f"Inputs {unknown_inputs} of derived feature '{name}' are not in config {self.config.name}")
+        if name in self.features:
+            # cached results of the previous function, and of features depending on it, are stale
+            with self._cache_lock:
+                self._cache.clear()
+        self.features[name] = DerivedFeature(name=name, inputs=list(inputs), func=func)
+
+    def _get_levels(self, names: list[str]) -> list[list[str]]:
+        """Group the features, and the registered features they depend on, into levels of independent features."""
+        graph = {}
+        pending = list(names)
+        while pending:
+            name = pending.pop()
+            if name in graph:
+                continue
+            graph[name] = [col for col in self.features[name].inputs if col in self.features]
+            pending.extend(graph[name])
+
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise ValueError(f"Derived features have a circular dependency: {e.args[1]}") from e
+        levels = []
+        while sorter.is_active():
+            level = list(sorter.get_ready())
+            levels.append(level)
+            sorter.done(*level)
+        return levels
+
+    def _compute_feature(
+        self, feature: DerivedFeature, columns: dict[str, pd.Series], fingerprints: dict[str, str]
+    ) -> tuple[np.ndarray, str]:
+        """Compute a single feature, or get it from the cache, returning the values and their fingerprint."""
+        key = (feature.name, *(fingerprints[col] for col in feature.inputs))
+        fingerprint = hashlib.sha256(repr(key).encode()).hexdigest()
+        with self._cache_lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key], fingerprint
+
+        values = np.asarray(feature.func(*(columns[col] for col in feature.inputs)))
+        if self.cache_size:
+            with self._cache_lock:
+                self._cache[key] = values
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return values, fingerprint
+
+    def compute(self, data: pd.DataFrame, features: list[str] | None = None) -> pd.DataFrame:
+        """
+        Compute the derived features missing from the data.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to add the features to
+        features : list[str], optional
+            The features to compute, defaults to every registered derived feature missing from the data
+
+        Returns
+        -------
+        pd.DataFrame
+            A new DataFrame with the features added, sharing the existing columns with the input data and
+            initialized with the engine's config
+
+        Raises
+        ------
+        ValueError
+            If a requested feature is not registered, or its inputs are missing from the data
+        """
+        if features is None:
+            features = [name for name in self.config.derived_features if name in self.features]
+        features = [name for name in features if name not in data.columns]
+        unregistered = [name for name in features if name not in self.features]
+        if unregistered:
+            raise ValueError(f"No function registered for derived features {unregistered}")
+
+        levels = self._get_levels(features)
+        to_compute = {name for level in levels for name in level if name not in data.columns}
+        raw_inputs = {col for name in to_compute for col in self.features[name].inputs if col not in to_compute}
+        missing_inputs = [col for col in raw_inputs if col not in data.columns]
+        if missing_inputs:
+            raise ValueError(f"Data is missing the inputs {missing_inputs} needed for derived features")
+
+        columns = {col: data[col] for col in raw_inputs}
+        if self.cache_size:
+            fingerprints = {
+                col: hashlib.sha256(pd.util.hash_pandas_object(series).to_numpy().tobytes()).hexdigest()
+                for col, series in columns.items()
+            }
+        else:
+            fingerprints = {col: col for col in columns}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for level in levels:
+                level = [name for name in level if name in to_compute]
+                if self.max_workers == 1 or len(level) == 1:
+                    results = [self._compute_feature(self.features[name], columns, fingerprints) for name in level]
+                else:
+                    results = list(executor.map(
+                        lambda name: self._compute_feature(self.features[name], columns, fingerprints), level
+                    ))
+                for name, (values, fingerprint) in zip(level, results):
+                    columns[name] = pd.Series(values, index=data.index, name=name)
+                    fingerprints[name] = fingerprint
+
+        new_columns = pd.DataFrame({name: columns[name] for name in self.config.derived_features if name in to_compute})
+        result = pd.concat([data, new_columns], axis=1, copy=False)
+        if data.smart_pandas.config is not None:
+            result.smart_pandas._inherit(data.smart_pandas)
+            result.smart_pandas.update()
+        else:
+            result.smart_pandas.load_config(config=self.config)
+        return result
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, MetaEstimatorMixin, clone
+from sklearn.utils.metaestimators import available_if
+from sklearn.utils.validation import check_is_fitted
+
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.state import StateError
+
+
+def _estimator_has(attr: str):
+    """Check that the fitted estimator, or else the unfitted one, has the given attribute."""
+    def check(self) -> bool:
+        return hasattr(getattr(self, "estimator_", self.estimator), attr)
+    return check
+
+
+class SmartPandasEstimator(MetaEstimatorMixin, BaseEstimator):
+    """
+    Scikit-learn wrapper which feeds an estimator the model features, target and weight defined in a config.
+
+    Column positions are resolved once at fit time. Later calls with DataFrames sharing the same columns, such as
+    row chunks of one frame, only pay for an identity check of the columns before the model features are taken
+    by position as a single contiguous array. No state inference or label based selection happens per call.
+    Calls with a different column layout resolve positions for that call only, so prediction never modifies the
+    fitted estimator and is safe to run concurrently.
+
+    Parameters
+    ----------
+    estimator : estimator object
+        The scikit-learn compatible estimator to wrap
+    config : DataConfig
+        The config defining the model features, target and weight columns
+    use_sample_weight : bool, default True
+        Whether to pass the weight column as `sample_weight` when fitting, if the config defines one
+    """
+
+    def __init__(self, estimator, config: DataConfig, use_sample_weight: bool = True):
+        self.estimator = estimator
+        self.config = config
+        self.use_sample_weight = use_sample_weight
+
+    def _resolve_columns(
+        self, columns: pd.Index, require_target: bool = False
+    ) -> tuple[np.ndarray, int | None, int | None]:
+        """Resolve the model feature, target and weight column positions for the given columns."""
+        missing = [col for col in self.config.model_features if col not in columns]
+        if require_target:
+            missing += [col for col in self.config.target if col not in columns]
+        if missing:
+            raise StateError(f"Data is missing the required columns {missing}, check the state of your data.")
+
+        feature_indices = columns.get_indexer(self.config.model_features)
+        target_indices = columns.get_indexer(self.config.target)
+        weight_indices = columns.get_indexer(self.config.weight)
+        target_index = target_indices[0] if len(target_indices) and target_indices[0] != -1 else None
+        weight_index = weight_indices[0] if len(weight_indices) and weight_indices[0] != -1 else None
+        return feature_indices, target_index, weight_index
+
+    def _get_features(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Get the model features as a contiguous array, X may also be an array already holding just the features."""
+        check_is_fitted(self, "feature_indices_")
+        if isinstance(X, np.ndarray):
+            return X
+        if X.columns is self._columns or X.columns.equals(self._columns):
+            feature_indices = self.feature_indices_
+        else:
+            # resolved per call rather than stored, so predicting never changes the fitted estimator
+            feature_indices = self._resolve_columns(X.columns)[0]
+        return np.ascontiguousarray(X.iloc[:, feature_indices].to_numpy())
+
+    def fit(self, X: pd.DataFrame, y=None, **fit_params) -> "SmartPandasEstimator":
+        """
+        Fit the wrapped estimator on the model features of X.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Training data containing the model features, and the target if y is not given
+        y : array-like, optional
+            Target values, defaults to the target column of X
+        **fit_params
+            Additional parameters passed to the wrapped estimator's fit method
+
+        Returns
+        -------
+        SmartPandasEstimator
+            The fitted estimator
+        """
+        self.feature_indices_, self.target_index_, self.weight_index_ = self._resolve_columns(
+            X.columns, require_target=y is None
+        )
+        self._columns = X.columns
+        if y is None:
+            y = X.iloc[:, self.target_index_].to_numpy()
+        if self.use_sample_weight and self.weight_index_ is not None and "sample_weight" not in fit_params:
+            fit_params["sample_weight"] = X.iloc[:, self.weight_index_].to_numpy()
+
+        self.estimator_ = clone(self.estimator).fit(self._get_features(X), y, **fit_params)
+        self.n_features_in_ = len(self.feature_indices_)
+        self.feature_names_in_ = np.asarray(self.config.model_features, dtype=object)
+        return self
+
+    def predict(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Predict with the wrapped estimator, using the model features of X."""
+        features = self._get_features(X)
+        return self.estimator_.predict(features)
+
+    @available_if(_estimator_has("predict_proba"))
+    def predict_proba(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Predict class probabilities with the wrapped estimator, using the model features of X."""
+        features = self._get_features(X)
+        return self.estimator_.predict_proba(features)
+
+    @available_if(_estimator_has("decision_function"))
+    def decision_function(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Compute the decision function of the wrapped estimator, using the model features of X."""
+        features = self._get_features(X)
+        return self.estimator_.decision_function(features)
+
+    @available_if(_estimator_has("transform"))
+    def transform(self, X: pd.DataFrame | np.ndarray) -> np.ndarray:
+        """Transform the model features of X with the wrapped estimator."""
+        features = self._get_features(X)
+        return self.estimator_.transform(features)
@@ -0,0 +1,103 @@
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class ValidationExecutor:
+    """
+    Managed thread pool for running blocking smart pandas work from asyncio code.
+
+    Work submitted through `run` is gated by a per event loop semaphore, so at most `max_concurrency` jobs
+    are in flight at once and any excess waits on the event loop rather than in the thread pool queue.
+    Cancelling a coroutine that is still waiting for a slot cancels it immediately. Work that has already
+    started runs to completion in its thread and its result is discarded.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_concurrency: int | None = None):
+        """
+        Initialize the executor.
+
+        Parameters
+        ----------
+        max_workers : int, optional
+            Number of worker threads, defaults to min(4, cpu_count)
+        max_concurrency : int, optional
+            Maximum number of jobs in flight per event loop, defaults to max_workers
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_concurrency = max_concurrency or self.max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the underlying thread pool."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="smart_pandas"
+                    )
+        return self._executor
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        """Get the concurrency semaphore bound to the given event loop."""
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking callable in the thread pool without blocking the running event loop.
+
+        Parameters
+        ----------
+        func : Callable
+            The blocking callable to run
+        *args, **kwargs
+            Arguments passed to the callable
+
+        Returns
+        -------
+        Any
+            The return value of the callable
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Shut down the underlying thread pool, it will be recreated on the next call to `run`."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+_default_executor = ValidationExecutor()
+
+
+def get_default_executor() -> ValidationExecutor:
+    """Get the executor used by the async smart pandas API when none is given."""
+    return _default_executor
+
+
+def set_default_executor(executor: ValidationExecutor) -> None:
+    """
+    Replace the executor used by the async smart pandas API when none is given.
+
+    Parameters
+    ----------
+    executor : ValidationExecutor
+        The new default executor
+    """
+    global _default_executor
+    if not isinstance(executor, ValidationExecutor):
+        raise TypeError(f"executor must be a ValidationExecutor, got {type(executor).__name__}")
+    _default_executor = executor
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from smart_pandas.config.data_config import DataConfig
+    from smart_pandas.state import State
+
+# Name of the file listing the columns of each cached array
+_COLUMNS_FILE = "columns.json"
+
+
+class FeatureMatrices(NamedTuple):
+    """
+    Tag group arrays of a DataFrame, memory mapped read-only from a FeatureCache.
+
+    Parameters
+    ----------
+    key: str
+        The cache key of the arrays, which other processes can pass to `FeatureCache.load`.
+    arrays: dict[str, np.ndarray]
+        The array of each tag data attribute, e.g. "model_features". Groups limited to a single column, such as the
+        target, are 1-D, others are 2-D with a column per config column.
+    columns: dict[str, list[str]]
+        The columns of each array, in order.
+    """
+
+    key: str
+    arrays: dict[str, np.ndarray]
+    columns: dict[str, list[str]]
+
+
+def data_fingerprint(data: pd.DataFrame, columns: list[str]) -> str:
+    """
+    Compute a fingerprint of the content of some columns of a DataFrame.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to fingerprint
+    columns : list[str]
+        The columns to include
+
+    Returns
+    -------
+    str
+        A hex digest of the column names, dtypes, index and values
+    """
+    hasher = hashlib.sha256(repr([(col, str(data[col].dtype)) for col in columns]).encode())
+    hasher.update(pd.util.hash_pandas_object(data[columns], index=True).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+def _to_numeric_array(frame: pd.DataFrame) -> np.ndarray:
+    """Convert the columns of a tag group to a single C-contiguous numeric array."""
+    values = frame.to_numpy()
+    if values.dtype.kind not in "biufcmM":
+        try:
+            values = frame.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Only numeric columns can be cached, got {list(frame.columns)}") from e
+    return np.ascontiguousarray(values)
+
+
+class FeatureCache:
+    """
+    Directory of memory mapped tag group arrays, shared by repeated training runs on the same data.
+
+    Arrays are written once per key as `.npy` files and mapped read-only with `np.load(mmap_mode="r")`, so every
+    process reading a key shares one copy of the data in the page cache. Entries are written to a temporary
+    directory and renamed into place, so readers never see a partially written entry, and concurrent writers of
+    the same key keep whichever entry is renamed first.
+    """
+
+    def __init__(self, directory: str):
+        """
+        Initialize the cache, creating its directory if needed.
+
+        Parameters
+        ----------
+        directory : str
+            The directory holding the cached arrays
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def build_key(data_key: str, config: "DataConfig", state: "State", data_attributes: list[str]) -> str:
+        """
+        Build the cache key of tag group arrays.
+
+        Parameters
+        ----------
+        data_key : str
+            Identifies the content of the data, e.g. from `data_fingerprint`
+        config : DataConfig
+            The config the arrays are extracted with
+        state : State
+            The state of the data
+        data_attributes : list[str]
+            The cached tag data attributes
+
+        Returns
+        -------
+        str
+            The key
+        """
+        key = (data_key, config.fingerprint, state.name.value, state.ml_stage.value, tuple(data_attributes))
+        return hashlib.sha256(repr(key).encode()).hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        return (self.directory / key).is_dir()
+
+    def load(self, key: str) -> FeatureMatrices | None:
+        """
+        Map the arrays of a key into this process.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+
+        Returns
+        -------
+        FeatureMatrices or None
+            The read-only arrays, or None if the key is not cached
+        """
+        path = self.directory / key
+        try:
+            columns = json.loads((path / _COLUMNS_FILE).read_text())
+        except FileNotFoundError:
+            return None
+        arrays = {name: np.load(path / f"{name}.npy", mmap_mode="r") for name in columns}
+        return FeatureMatrices(key=key, arrays=arrays, columns=columns)
+
+    def store(self, key: str, frames: dict[str, pd.DataFrame], flatten: tuple[str, ...] = ()) -> FeatureMatrices:
+        """
+        Write tag group arrays to the cache, and map them back.
+
+        Parameters
+        ----------
+        key : str
+            The cache key
+        frames : dict[str, pd.DataFrame]
+            The columns of each tag data attribute, which must be numeric
+        flatten : tuple[str, ...], default ()
+            Data attributes with a single column to store as 1-D arrays
+
+        Returns
+        -------
+        FeatureMatrices
+            The cached arrays
+
+        Raises
+        ------
+        ValueError
+            If a column is not numeric
+        """
+        arrays = {name: _to_numeric_array(frame) for name, frame in frames.items()}
+        arrays = {name: array.ravel() if name in flatten else array for name, array in arrays.items()}
+        columns = {name: [str(col) for col in frame.columns] for name, frame in frames.items()}
+
+        temporary = Path(tempfile.mkdtemp(prefix=".tmp-", dir=self.directory))
+        try:
+            for name, array in arrays.items():
+                np.save(temporary / f"{name}.npy", array, allow_pickle=False)
+            (temporary / _COLUMNS_FILE).write_text(json.dumps(columns))
+            try:
+                os.rename(temporary, self.directory / key)
+            except OSError:
+                # another process stored the key first, its arrays are identical
+                if key not in self:
+                    raise
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
+        return self.load(key)
+
+    def __repr__(self) -> str:
+        return f"FeatureCache(directory='{self.directory}')"
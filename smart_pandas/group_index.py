@@ -0,0 +1,192 @@
+import numpy as np
+import pandas as pd
+
+# Per group reductions supported by `GroupIndex.transform`
+_TRANSFORMS = ("sum", "mean", "min", "max", "count", "size", "first", "last")
+# Window reductions supported by `GroupIndex.rolling`
+_ROLLING = ("sum", "mean", "count")
+
+
+class GroupIndex:
+    """
+    Factorised entity groups of a key column, with the rows of each group sorted by timestamp.
+
+    The keys are factorised and sorted once, and the result is reused by every per entity feature, so computing
+    many features costs a single factorisation. Rows are stored as a sort permutation grouping the rows of each
+    entity together in timestamp order, with the boundaries of each group. Rows with a null key belong to no group,
+    and get NaN from every feature.
+    """
+
+    def __init__(self, keys: pd.Series, timestamps: pd.Series | None = None):
+        """
+        Initialize the group index.
+
+        Parameters
+        ----------
+        keys : pd.Series
+            The entity key of each row
+        timestamps : pd.Series, optional
+            The timestamp of each row, rows within a group are kept in their original order if None
+        """
+        codes, self.uniques = pd.factorize(keys, sort=False)
+        self.codes = codes
+        self.num_rows = len(codes)
+
+        if timestamps is None:
+            order = np.arange(self.num_rows)
+        else:
+            # NaT timestamps are placed last within their group
+            order = timestamps.array.argsort(kind="stable")
+        order = order[np.argsort(codes[order], kind="stable")]
+        # null keys have code -1, so are sorted to the front and dropped
+        self.order = order[np.count_nonzero(codes == -1):]
+
+        self.sizes = np.bincount(codes[codes != -1], minlength=len(self.uniques))
+        self.ends = np.cumsum(self.sizes)
+        self.starts = self.ends - self.sizes
+        # position of each sorted row within its group
+        self.ranks = np.arange(len(self.order)) - np.repeat(self.starts, self.sizes)
+
+    @property
+    def ngroups(self) -> int:
+        """The number of groups."""
+        return len(self.uniques)
+
+    def _sorted_values(self, values) -> np.ndarray:
+        """Take the values of the grouped rows in sorted order, as floats."""
+        if isinstance(values, pd.Series):
+            values = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        return np.asarray(values, dtype=np.float64)[self.order]
+
+    def _unsort(self, sorted_values: np.ndarray) -> np.ndarray:
+        """Scatter values in sorted order back to the original row order, with NaN for rows without a group."""
+        result = np.full(self.num_rows, np.nan)
+        result[self.order] = sorted_values
+        return result
+
+    def transform(self, values, func: str) -> np.ndarray:
+        """
+        Reduce the values of each group, and broadcast the result to every row of the group.
+
+        Parameters
+        ----------
+        values : array-like
+            The numeric values of each row, in the original row order
+        func : str
+            One of "sum", "mean", "min", "max", "count", "size", "first" or "last". NaN values are skipped, except
+            by "size", "first" and "last", which are taken in timestamp order.
+
+        Returns
+        -------
+        np.ndarray
+            The reduced value of each row's group
+
+        Raises
+        ------
+        ValueError
+            If func is not supported
+        """
+        if func not in _TRANSFORMS:
+            raise ValueError(f"Unsupported transform '{func}', expected any of {_TRANSFORMS}")
+        if func == "size":
+            return self._unsort(np.repeat(self.sizes, self.sizes).astype(np.float64))
+
+        sorted_values = self._sorted_values(values)
+        result = np.full(self.ngroups, np.nan)
+        non_empty = self.sizes > 0
+        starts = self.starts[non_empty]
+        if func == "first":
+            result[non_empty] = sorted_values[starts]
+        elif func == "last":
+            result[non_empty] = sorted_values[self.ends[non_empty] - 1]
+        elif func in ("min", "max"):
+            reduce = np.fmin if func == "min" else np.fmax
+            result[non_empty] = reduce.reduceat(sorted_values, starts)
+        else:
+            valid = ~np.isnan(sorted_values)
+            counts = np.add.reduceat(valid, starts)
+            if func == "count":
+                result[non_empty] = counts
+            else:
+                sums = np.add.reduceat(np.where(valid, sorted_values, 0), starts)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result[non_empty] = sums if func == "sum" else sums / counts
+        return self._unsort(np.repeat(result, self.sizes))
+
+    def lag(self, values, periods: int = 1) -> np.ndarray:
+        """
+        Shift the values within each group by a number of rows in timestamp order.
+
+        Parameters
+        ----------
+        values : array-like
+            The numeric values of each row, in the original row order
+        periods : int, default 1
+            The number of rows to shift by, negative values take later rows
+
+        Returns
+        -------
+        np.ndarray
+            The shifted values, NaN where the shifted row is outside the group
+        """
+        sorted_values = self._sorted_values(values)
+        shifted = np.full(len(sorted_values), np.nan)
+        sizes = np.repeat(self.sizes, self.sizes)
+        source = self.ranks - periods
+        mask = (source >= 0) & (source < sizes)
+        shifted[mask] = sorted_values[np.flatnonzero(mask) - periods]
+        return self._unsort(shifted)
+
+    def rolling(self, values, window: int | None, func: str = "mean", min_periods: int = 1) -> np.ndarray:
+        """
+        Reduce the values over a trailing window of rows within each group, in timestamp order.
+
+        Parameters
+        ----------
+        values : array-like
+            The numeric values of each row, in the original row order
+        window : int or None
+            The number of rows in each window, including the current row. None uses every earlier row of the group.
+        func : str, default "mean"
+            One of "sum", "mean" or "count", NaN values are skipped
+        min_periods : int, default 1
+            The minimum number of non-NaN values in a window for a result, otherwise NaN
+
+        Returns
+        -------
+        np.ndarray
+            The reduced value of each row's window
+
+        Raises
+        ------
+        ValueError
+            If func is not supported or window is not positive
+        """
+        if func not in _ROLLING:
+            raise ValueError(f"Unsupported rolling function '{func}', expected any of {_ROLLING}")
+        if window is not None and window < 1:
+            raise ValueError("window must be a positive number of rows")
+
+        sorted_values = self._sorted_values(values)
+        valid = ~np.isnan(sorted_values)
+        # windows are differences of cumulative sums, so every window costs O(1)
+        cumulative_sums = np.concatenate([[0.0], np.cumsum(np.where(valid, sorted_values, 0))])
+        cumulative_counts = np.concatenate([[0], np.cumsum(valid)])
+        stops = np.arange(1, len(sorted_values) + 1)
+        starts = np.repeat(self.starts, self.sizes)
+        if window is not None:
+            starts = np.maximum(starts, stops - window)
+
+        counts = cumulative_counts[stops] - cumulative_counts[starts]
+        if func == "count":
+            result = counts.astype(np.float64)
+        else:
+            result = cumulative_sums[stops] - cumulative_sums[starts]
+            if func == "mean":
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    result = result / counts
+        result[counts < min_periods] = np.nan
+        return self._unsort(result)
+
+    def __repr__(self) -> str:
+        return f"GroupIndex(groups={self.ngroups}, rows={self.num_rows})"
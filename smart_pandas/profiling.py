@@ -0,0 +1,362 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+
+class HyperLogLog:
+    """
+    HyperLogLog sketch for estimating the number of distinct values, mergeable across chunks.
+
+    The relative standard error of the estimate is about 1.04 / sqrt(2 ** precision).
+    """
+
+    def __init__(self, precision: int = 12):
+        """
+        Initialize an empty sketch.
+
+        Parameters
+        ----------
+        precision : int, default 12
+            Number of hash bits used to select a register, between 11 and 18
+        """
+        if not 11 <= precision <= 18:
+            raise ValueError("precision must be between 11 and 18")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def add(self, values: pd.Series | np.ndarray) -> None:
+        """Add the non-null values to the sketch."""
+        values = pd.Series(values).dropna()
+        if values.empty:
+            return
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        remaining_bits = 64 - self.precision
+        index = (hashes >> np.uint64(remaining_bits)).astype(np.intp)
+        remainder = hashes & np.uint64((1 << remaining_bits) - 1)
+        # remainder < 2 ** 53, so float conversion is exact and frexp gives its bit length
+        bit_length = np.frexp(remainder.astype(np.float64))[1]
+        rank = (remaining_bits - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Return a sketch of the union of both sketches' values."""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision")
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def estimate(self) -> float:
+        """Estimate the number of distinct values added."""
+        num_registers = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / num_registers)
+        estimate = alpha * num_registers ** 2 / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zero_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * num_registers and zero_registers:
+            # linear counting is more accurate for small cardinalities
+            estimate = num_registers * math.log(num_registers / zero_registers)
+        return float(estimate)
+
+    def to_dict(self) -> dict:
+        return {"precision": self.precision, "registers": self.registers.tolist()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HyperLogLog":
+        sketch = cls(data["precision"])
+        sketch.registers = np.asarray(data["registers"], dtype=np.uint8)
+        return sketch
+
+
+class TDigest:
+    """
+    t-digest sketch for estimating quantiles, mergeable across chunks.
+
+    Values are summarised as weighted centroids, which are smallest in the tails so that extreme quantiles are
+    estimated most accurately. Adding and merging are vectorised: points are sorted and assigned to buckets of the
+    k1 scale function, and each bucket is collapsed into a centroid.
+    """
+
+    def __init__(self, compression: float = 100):
+        """
+        Initialize an empty sketch.
+
+        Parameters
+        ----------
+        compression : float, default 100
+            Controls the number of centroids kept, and so the size and accuracy of the sketch
+        """
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = np.inf
+        self.max = -np.inf
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    def _compress(self, means: np.ndarray, weights: np.ndarray) -> None:
+        """Collapse the weighted points into centroids."""
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        cumulative = np.cumsum(weights)
+        quantiles = (cumulative - weights / 2) / total
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * quantiles - 1)
+        buckets = np.floor(scale - scale[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def add(self, values: np.ndarray) -> None:
+        """Add the non-NaN values to the sketch."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._compress(np.concatenate([self.means, values]), np.concatenate([self.weights, np.ones(values.size)]))
+
+    def merge(self, other: "TDigest") -> "TDigest":
+        """Return a sketch of the union of both sketches' values."""
+        merged = TDigest(self.compression)
+        merged.min, merged.max = min(self.min, other.min), max(self.max, other.max)
+        if self.weights.size or other.weights.size:
+            merged._compress(
+                np.concatenate([self.means, other.means]), np.concatenate([self.weights, other.weights])
+            )
+        return merged
+
+    def quantile(self, q: float | np.ndarray) -> float | np.ndarray:
+        """Estimate quantile(s) of the values added, NaN if the sketch is empty."""
+        if self.weights.size == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        cumulative = np.cumsum(self.weights)
+        centers = (cumulative - self.weights / 2) / cumulative[-1]
+        result = np.interp(q, np.r_[0.0, centers, 1.0], np.r_[self.min, self.means, self.max])
+        return result if np.ndim(q) else float(result)
+
+    def to_dict(self) -> dict:
+        return {
+            "compression": self.compression,
+            "means": self.means.tolist(),
+            "weights": self.weights.tolist(),
+            "min": float(self.min),
+            "max": float(self.max),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TDigest":
+        sketch = cls(data["compression"])
+        sketch.means = np.asarray(data["means"], dtype=np.float64)
+        sketch.weights = np.asarray(data["weights"], dtype=np.float64)
+        sketch.min, sketch.max = data["min"], data["max"]
+        return sketch
+
+
+class ColumnProfile:
+    """
+    Mergeable summary statistics of a column.
+
+    Counts, extremes and moments are exact and merged with the parallel variance algorithm. Quantiles and the
+    number of distinct values are estimated with a TDigest and a HyperLogLog sketch. Non-numeric columns only have
+    counts and distinct values.
+
+    Parameters
+    ----------
+    count: int
+        The number of non-null values.
+    null_count: int
+        The number of null values.
+    minimum: float
+        The smallest value, NaN if the column is empty or not numeric.
+    maximum: float
+        The largest value, NaN if the column is empty or not numeric.
+    mean: float
+        The mean value, NaN if the column is empty or not numeric.
+    m2: float
+        The sum of squared differences from the mean.
+    quantiles: TDigest | None
+        The quantile sketch, None if the column is not numeric.
+    distinct: HyperLogLog
+        The distinct value sketch.
+    """
+
+    def __init__(
+        self,
+        count: int = 0,
+        null_count: int = 0,
+        minimum: float = np.nan,
+        maximum: float = np.nan,
+        mean: float = np.nan,
+        m2: float = 0.0,
+        quantiles: TDigest | None = None,
+        distinct: HyperLogLog | None = None,
+    ):
+        self.count = count
+        self.null_count = null_count
+        self.minimum = minimum
+        self.maximum = maximum
+        self.mean = mean
+        self.m2 = m2
+        self.quantiles = quantiles
+        self.distinct = distinct if distinct is not None else HyperLogLog()
+
+    @property
+    def is_numeric(self) -> bool:
+        return self.quantiles is not None
+
+    @property
+    def variance(self) -> float:
+        """The sample variance, NaN with fewer than two values."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def cardinality(self) -> float:
+        """The estimated number of distinct non-null values."""
+        return self.distinct.estimate()
+
+    def quantile(self, q: float | np.ndarray) -> float | np.ndarray:
+        """Estimate quantile(s) of the column."""
+        if self.quantiles is None:
+            raise TypeError("Quantiles are only available for numeric columns")
+        return self.quantiles.quantile(q)
+
+    def merge(self, other: "ColumnProfile") -> "ColumnProfile":
+        """Return the profile of both profiles' data combined."""
+        if self.is_numeric != other.is_numeric:
+            raise ValueError("Cannot merge numeric and non-numeric column profiles")
+        count = self.count + other.count
+        if not self.count or not other.count:
+            source = self if self.count else other
+            mean, m2, minimum, maximum = source.mean, source.m2, source.minimum, source.maximum
+        else:
+            delta = other.mean - self.mean
+            mean = self.mean + delta * other.count / count
+            m2 = self.m2 + other.m2 + delta ** 2 * self.count * other.count / count
+            minimum, maximum = min(self.minimum, other.minimum), max(self.maximum, other.maximum)
+        return ColumnProfile(
+            count=count,
+            null_count=self.null_count + other.null_count,
+            minimum=minimum,
+            maximum=maximum,
+            mean=mean,
+            m2=m2,
+            quantiles=self.quantiles.merge(other.quantiles) if self.is_numeric else None,
+            distinct=self.distinct.merge(other.distinct),
+        )
+
+    def to_dict(self) -> dict:
+        """Serialise the profile to a JSON compatible dictionary."""
+        return {
+            "count": int(self.count),
+            "null_count": int(self.null_count),
+            "minimum": float(self.minimum),
+            "maximum": float(self.maximum),
+            "mean": float(self.mean),
+            "m2": float(self.m2),
+            "quantiles": self.quantiles.to_dict() if self.quantiles is not None else None,
+            "distinct": self.distinct.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ColumnProfile":
+        """Deserialise a profile from `to_dict`."""
+        return cls(
+            count=data["count"],
+            null_count=data["null_count"],
+            minimum=data["minimum"],
+            maximum=data["maximum"],
+            mean=data["mean"],
+            m2=data["m2"],
+            quantiles=TDigest.from_dict(data["quantiles"]) if data["quantiles"] is not None else None,
+            distinct=HyperLogLog.from_dict(data["distinct"]),
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnProfile(count={self.count}, null_count={self.null_count}, mean={self.mean}, "
+            f"cardinality~{self.cardinality:.0f})"
+        )
+
+
+def profile_columns(data: pd.DataFrame, columns: list[str]) -> dict[str, ColumnProfile]:
+    """
+    Profile columns of a DataFrame, computing the statistics of all numeric columns in one vectorised pass.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to profile
+    columns : list[str]
+        The columns to profile
+
+    Returns
+    -------
+    dict[str, ColumnProfile]
+        The profile of each column
+    """
+    numeric_columns = [
+        col for col in columns
+        if pd.api.types.is_numeric_dtype(data[col].dtype) and not pd.api.types.is_complex_dtype(data[col].dtype)
+    ]
+    profiles = {}
+    if numeric_columns:
+        block = data[numeric_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(block)
+        counts = valid.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sums = np.where(valid, block, 0.0).sum(axis=0)
+            means = np.where(counts > 0, sums / counts, np.nan)
+            m2 = np.where(valid, (block - means) ** 2, 0.0).sum(axis=0)
+        minimums = np.where(valid, block, np.inf).min(axis=0, initial=np.inf)
+        maximums = np.where(valid, block, -np.inf).max(axis=0, initial=-np.inf)
+        for position, col in enumerate(numeric_columns):
+            quantiles = TDigest()
+            quantiles.add(block[:, position])
+            distinct = HyperLogLog()
+            distinct.add(block[valid[:, position], position])
+            profiles[col] = ColumnProfile(
+                count=int(counts[position]),
+                null_count=int(len(block) - counts[position]),
+                minimum=float(minimums[position]) if counts[position] else np.nan,
+                maximum=float(maximums[position]) if counts[position] else np.nan,
+                mean=float(means[position]),
+                m2=float(m2[position]),
+                quantiles=quantiles,
+                distinct=distinct,
+            )
+
+    for col in columns:
+        if col in profiles:
+            continue
+        values = data[col]
+        distinct = HyperLogLog()
+        distinct.add(values)
+        null_count = int(values.isna().sum())
+        profiles[col] = ColumnProfile(count=len(values) - null_count, null_count=null_count, distinct=distinct)
+
+    return {col: profiles[col] for col in columns}
+
+
+def merge_profiles(*profiles: dict[str, ColumnProfile]) -> dict[str, ColumnProfile]:
+    """
+    Merge column profiles, e.g. from different chunks, processes or days.
+
+    Parameters
+    ----------
+    *profiles : dict[str, ColumnProfile]
+        Column profiles, as returned by `profile_columns`
+
+    Returns
+    -------
+    dict[str, ColumnProfile]
+        The merged profile of each column found in any of the inputs
+    """
+    merged: dict[str, ColumnProfile] = {}
+    for column_profiles in profiles:
+        for col, profile in column_profiles.items():
+            merged[col] = merged[col].merge(profile) if col in merged else profile
+    return merged
@@ -0,0 +1,130 @@
+import threading
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pandera as pa
+
+from smart_pandas.schema import ValidationPlan, build_expected_dtypes, build_schema, build_validation_schema
+
+if TYPE_CHECKING:
+    from smart_pandas.config.data_config import DataConfig
+    from smart_pandas.config.watcher import ConfigDiff
+    from smart_pandas.state import State
+
+# Process local registries, keyed by config fingerprint so that equal configs loaded separately are shared
+_CONFIGS: dict[str, "DataConfig"] = {}
+_SCHEMAS: dict[tuple, pa.DataFrameSchema] = {}
+_EXPECTED_DTYPES: dict[tuple, pd.Series] = {}
+_lock = threading.Lock()
+
+
+def register_config(config: "DataConfig") -> "DataConfig":
+    """
+    Register a config in the process local registry, so it can be looked up by fingerprint.
+
+    This is suitable as a worker pool initializer, so that each worker receives the config once rather than
+    with every task.
+
+    Parameters
+    ----------
+    config : DataConfig
+        The config to register
+
+    Returns
+    -------
+    DataConfig
+        The registered config with the same fingerprint, which is the given config unless an equal one was
+        registered first. Configs are only equal if their custom checks have the same functions, see
+        `DataConfig.fingerprint`.
+    """
+    fingerprint = config.fingerprint
+    with _lock:
+        return _CONFIGS.setdefault(fingerprint, config)
+
+
+def get_config(fingerprint: str) -> "DataConfig":
+    """
+    Get a registered config by fingerprint.
+
+    Raises
+    ------
+    KeyError
+        If no config with the fingerprint is registered in this process
+    """
+    try:
+        return _CONFIGS[fingerprint]
+    except KeyError:
+        raise KeyError(
+            f"No config with fingerprint {fingerprint} is registered in this process. Register it with "
+            "smart_pandas.registry.register_config, e.g. as a worker pool initializer."
+        ) from None
+
+
+def get_schema(
+    config: "DataConfig", state: "State", plan: ValidationPlan | None = None
+) -> pa.DataFrameSchema:
+    """
+    Get the Pandera schema for a config and state, building it on first use.
+
+    Parameters
+    ----------
+    config : DataConfig
+        The configuration object containing column definitions
+    state : State
+        The current state of the data
+    plan : ValidationPlan, optional
+        Get the variant of the schema for validating data according to the plan, see `build_validation_schema`
+
+    Returns
+    -------
+    pa.DataFrameSchema
+        The cached schema
+    """
+    key = (config.fingerprint, state.name, state.ml_stage, plan)
+    schema = _SCHEMAS.get(key)
+    if schema is None:
+        if plan is None:
+            schema = build_schema(config, state)
+        else:
+            schema = build_validation_schema(get_schema(config, state), plan)
+        with _lock:
+            schema = _SCHEMAS.setdefault(key, schema)
+    return schema
+
+
+def get_expected_dtypes(config: "DataConfig", state: "State") -> pd.Series:
+    """Get the dtype of each column in the schema of a config and state, see `schema.build_expected_dtypes`."""
+    key = (config.fingerprint, state.name, state.ml_stage)
+    expected_dtypes = _EXPECTED_DTYPES.get(key)
+    if expected_dtypes is None:
+        expected_dtypes = build_expected_dtypes(get_schema(config, state))
+        with _lock:
+            expected_dtypes = _EXPECTED_DTYPES.setdefault(key, expected_dtypes)
+    return expected_dtypes
+
+
+def migrate_schemas(old: "DataConfig", new: "DataConfig", diff: "ConfigDiff") -> None:
+    """
+    Carry the cached schemas of an old version of a config over to a new version, for states the diff doesn't affect.
+
+    Schemas of affected states are built for the new config on first use. The old config's entries are kept, as
+    data may still be using it.
+
+    Parameters
+    ----------
+    old : DataConfig
+        The previous version of the config
+    new : DataConfig
+        The new version of the config
+    diff : ConfigDiff
+        The differences between the versions
+    """
+    from smart_pandas.state import State
+
+    register_config(new)
+    with _lock:
+        for cache in (_SCHEMAS, _EXPECTED_DTYPES):
+            for key, value in list(cache.items()):
+                fingerprint, state_name, ml_stage, *rest = key
+                if fingerprint == old.fingerprint and not diff.affects_state(new, State(state_name, ml_stage)):
+                    cache.setdefault((new.fingerprint, state_name, ml_stage, *rest), value)
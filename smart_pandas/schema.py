@@ -1,7 +1,11 @@
 
-from typing import TYPE_CHECKING
+import copy
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+import numpy as np
+import pandas as pd
 import pandera as pa
+from pandera.engines import pandas_engine
 
 if TYPE_CHECKING:
     from smart_pandas.config.data_config import DataConfig
@@ -25,6 +29,51 @@ def get_default_df_schema_params() -> dict[str, bool]:
     }
 
 
+def to_arrow_dtype(dtype: Any) -> Any:
+    """
+    Get the Arrow backed pandas dtype equivalent to a NumPy or pandas string dtype.
+
+    Other dtypes, including ones which are already Arrow backed, are returned unchanged.
+
+    Parameters
+    ----------
+    dtype : Any
+        The dtype to convert
+
+    Returns
+    -------
+    Any
+        The equivalent `pd.ArrowDtype`, or the input dtype
+
+    Raises
+    ------
+    ImportError
+        If pyarrow is not installed
+    """
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for the 'pyarrow' dtype_backend, install it with `pip install smart-pandas[arrow]`"
+        ) from e
+
+    if isinstance(dtype, pd.StringDtype) or (isinstance(dtype, np.dtype) and dtype.kind == "U"):
+        return pd.ArrowDtype(pyarrow.string())
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufmM":
+        return pd.ArrowDtype(pyarrow.from_numpy_dtype(dtype))
+    return dtype
+
+
+def _with_arrow_dtype(column_schema: pa.Column) -> pa.Column:
+    """Copy a column schema, converting its dtype to the Arrow backed equivalent."""
+    arrow_dtype = to_arrow_dtype(column_schema.dtype.type)
+    if arrow_dtype is column_schema.dtype.type:
+        return column_schema
+    column_schema = copy.deepcopy(column_schema)
+    column_schema.dtype = arrow_dtype
+    return column_schema
+
+
 def build_schema(config: "DataConfig", state: "State") -> pa.DataFrameSchema:
     """
     Build a Pandera schema for the DataFrame based on configuration and state.
@@ -46,7 +95,7 @@ def build_schema(config: "DataConfig", state: "State") -> pa.DataFrameSchema:
     ValueError
         If no columns are found for the current state
     """
-    state_columns = state.get_state_columns(config)
+    state_columns = set(state.get_state_columns(config))
     
     if not state_columns:
         raise ValueError(f"No columns found for state: {state}")
@@ -59,5 +108,149 @@ def build_schema(config: "DataConfig", state: "State") -> pa.DataFrameSchema:
     
     if not column_schemas:
         raise ValueError(f"No valid column schemas found for state: {state}")
+
+    if config.dtype_backend == "pyarrow":
+        # validate Arrow backed data against Arrow dtypes, so it's never coerced back to NumPy or Python objects
+        column_schemas = {name: _with_arrow_dtype(column_schema) for name, column_schema in column_schemas.items()}
     
     return pa.DataFrameSchema(column_schemas, **get_default_df_schema_params())
+
+
+class ValidationPlan(NamedTuple):
+    """
+    Columns of a DataFrame which are validated outside of Pandera's per-column machinery.
+
+    Parameters
+    ----------
+    coerce_columns: frozenset[str]
+        Columns whose dtype doesn't match the schema, the only columns which are coerced.
+    fused_columns: frozenset[str]
+        Columns with exactly the schema's NumPy dtype and no checks other than nullability. Their nulls are
+        checked by `find_null_columns`, and Pandera skips them. Columns with value checks are never fused, their
+        checks still run per column through Pandera.
+    """
+
+    coerce_columns: frozenset[str]
+    fused_columns: frozenset[str]
+
+
+def build_expected_dtypes(schema: pa.DataFrameSchema) -> pd.Series:
+    """Get the dtype of each column of the schema, NaN for columns without a dtype."""
+    return pd.Series(
+        {
+            name: column_schema.dtype.type if column_schema.dtype is not None else np.nan
+            for name, column_schema in schema.columns.items()
+        },
+        dtype=object,
+    )
+
+
+def plan_validation(
+    schema: pa.DataFrameSchema, expected_dtypes: pd.Series, data: pd.DataFrame
+) -> ValidationPlan | None:
+    """
+    Plan the validation of data, comparing its dtypes to the schema in one vectorised comparison.
+
+    Only columns whose dtype isn't exactly the expected one are coerced: object and extension columns always, as
+    their dtype doesn't tell the type of their values, and NumPy columns when they fail Pandera's dtype check.
+
+    Parameters
+    ----------
+    schema : pa.DataFrameSchema
+        The schema to validate against
+    expected_dtypes : pd.Series
+        The dtypes of the schema, see `build_expected_dtypes`
+    data : pd.DataFrame
+        The data to validate
+
+    Returns
+    -------
+    ValidationPlan or None
+        The plan, or None if the data has duplicate column names, which the schema rejects anyway
+    """
+    if not data.columns.is_unique:
+        return None
+    actual_dtypes = data.dtypes.reindex(expected_dtypes.index)
+    exact = actual_dtypes.to_numpy() == expected_dtypes.to_numpy()
+
+    coerce_columns = []
+    fused_columns = []
+    for name, is_exact, dtype in zip(expected_dtypes.index, exact, actual_dtypes):
+        column_schema = schema.columns[name]
+        if is_exact:
+            if (
+                isinstance(dtype, np.dtype) and dtype.kind in "biufcmM"
+                and not column_schema.checks and not column_schema.unique
+            ):
+                fused_columns.append(name)
+        elif column_schema.dtype is None:
+            continue
+        elif isinstance(dtype, pd.api.extensions.ExtensionDtype) or (isinstance(dtype, np.dtype) and dtype.kind == "O"):
+            # the dtype says nothing about the type of each value, e.g. a str column holding ints passes the dtype
+            # check but not the element type check, so these columns are always coerced
+            coerce_columns.append(name)
+        elif isinstance(dtype, np.dtype) and not column_schema.dtype.check(pandas_engine.Engine.dtype(dtype)):
+            coerce_columns.append(name)
+    return ValidationPlan(frozenset(coerce_columns), frozenset(fused_columns))
+
+
+def find_null_columns(data: pd.DataFrame, columns: list[str]) -> list[str]:
+    """
+    Find the columns containing nulls, with one vectorised null test per column.
+
+    Columns are grouped by dtype only to pick the null test, each column is then tested on a view of its data, so
+    nothing is copied. Integer and boolean columns are skipped, as they can't hold nulls.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data to check, with unique column names
+    columns : list[str]
+        The columns to check, all with a NumPy dtype
+
+    Returns
+    -------
+    list[str]
+        The columns containing nulls
+    """
+    columns_by_dtype: dict[np.dtype, list[str]] = {}
+    for name in columns:
+        columns_by_dtype.setdefault(data.dtypes[name], []).append(name)
+
+    null_columns = []
+    for dtype, names in columns_by_dtype.items():
+        if dtype.kind not in "fcmM":
+            continue
+        is_null = np.isnat if dtype.kind in "mM" else np.isnan
+        null_columns.extend(name for name in names if is_null(data[name].to_numpy()).any())
+    return null_columns
+
+
+def build_validation_schema(schema: pa.DataFrameSchema, plan: ValidationPlan) -> pa.DataFrameSchema:
+    """
+    Copy a schema for validating data according to a plan.
+
+    Pandera's coercion copies every column, even when it already has the right dtype, so only the columns which
+    need it are coerced. Fused columns keep only the requirement to be present, as their dtype and nulls have
+    already been checked.
+
+    Parameters
+    ----------
+    schema : pa.DataFrameSchema
+        The schema to copy
+    plan : ValidationPlan
+        The validation plan
+
+    Returns
+    -------
+    pa.DataFrameSchema
+        The schema for validating data according to the plan
+    """
+    schema = copy.deepcopy(schema)
+    schema.coerce = False
+    for name, column_schema in schema.columns.items():
+        column_schema.coerce = name in plan.coerce_columns
+        if name in plan.fused_columns:
+            column_schema.dtype = None
+            column_schema.nullable = True
+    return schema
@@ -0,0 +1,136 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+# Byte alignment of each column in a shared frame file
+_ALIGNMENT = 64
+
+
+class AccessorState(NamedTuple):
+    """
+    Compact, picklable snapshot of a SmartPandas accessor.
+
+    The config is referenced by fingerprint and resolved against the process local registry when restored,
+    see `smart_pandas.registry`.
+
+    Parameters
+    ----------
+    config_fingerprint: str
+        The fingerprint of the accessor's config.
+    state_name: str
+        The value of the accessor's StateName.
+    ml_stage: str
+        The value of the accessor's MLStage.
+    auto_update: bool
+        Whether the accessor automatically updates its state.
+    validated: bool
+        Whether the data had passed validation.
+    """
+
+    config_fingerprint: str
+    state_name: str
+    ml_stage: str
+    auto_update: bool
+    validated: bool
+
+
+def _default_directory() -> str:
+    """Use the shared memory filesystem where available, so the data never has to reach disk."""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedFrame:
+    """
+    Picklable handle to a DataFrame held in shared memory, for fanning out data to worker processes.
+
+    Columns with a plain NumPy dtype are written once to a memory mapped file (in `/dev/shm` where available) and
+    mapped read-only by each process that opens the handle, so N workers share one copy of the data. Other
+    columns, e.g. object or extension dtypes, are pickled with the handle. The accessor state travels as an
+    `AccessorState`, so opening the handle neither re-reads the config nor re-infers the state.
+
+    The owner of the handle should call `unlink`, or use it as a context manager, once the workers have opened it.
+    """
+
+    def __init__(self, data: pd.DataFrame, directory: str | None = None):
+        """
+        Write a DataFrame to shared memory.
+
+        Parameters
+        ----------
+        data : pd.DataFrame
+            The data to share, with an initialized SmartPandas accessor
+        directory : str, optional
+            Directory for the memory mapped file, defaults to `/dev/shm` if it exists or the temp directory
+        """
+        self.accessor_state = data.smart_pandas.export_state()
+        self.columns = data.columns
+        self.index = data.index
+        self.num_rows = len(data)
+        self.layout: dict[int, tuple[str, int]] = {}
+        self.pickled_columns: dict[int, pd.Series] = {}
+
+        file_descriptor, path = tempfile.mkstemp(suffix=".smart_pandas", dir=directory or _default_directory())
+        self.path = path
+        try:
+            with os.fdopen(file_descriptor, "wb") as stream:
+                self._write_columns(data, stream)
+        except BaseException:
+            self.unlink()
+            raise
+
+    def _write_columns(self, data: pd.DataFrame, stream) -> None:
+        """Write the NumPy dtype columns to the stream at aligned offsets, and keep the rest for pickling."""
+        offset = 0
+        for position in range(data.shape[1]):
+            column = data.iloc[:, position]
+            if not isinstance(column.dtype, np.dtype) or column.dtype.kind not in "biufcmM":
+                self.pickled_columns[position] = column
+                continue
+            values = np.ascontiguousarray(column.to_numpy())
+            padding = -offset % _ALIGNMENT
+            stream.write(b"\0" * padding)
+            offset += padding
+            self.layout[position] = (values.dtype.str, offset)
+            stream.write(values.view(np.uint8))
+            offset += values.nbytes
+
+    def open(self) -> pd.DataFrame:
+        """
+        Map the shared data into this process as a read-only DataFrame with its accessor restored.
+
+        Returns
+        -------
+        pd.DataFrame
+            The shared DataFrame
+        """
+        arrays = {}
+        if self.layout and Path(self.path).stat().st_size > 0:
+            buffer = np.memmap(self.path, dtype=np.uint8, mode="r")
+        for position in range(len(self.columns)):
+            if position in self.pickled_columns:
+                arrays[position] = self.pickled_columns[position].array
+                continue
+            dtype, offset = self.layout[position]
+            if self.num_rows:
+                arrays[position] = np.frombuffer(buffer, dtype=dtype, count=self.num_rows, offset=offset)
+            else:
+                arrays[position] = np.empty(0, dtype=dtype)
+
+        data = pd.DataFrame(arrays, index=self.index, copy=False)
+        data.columns = self.columns
+        data.smart_pandas.restore_state(self.accessor_state)
+        return data
+
+    def unlink(self) -> None:
+        """Remove the shared memory file, processes which have already opened it keep their mapping."""
+        Path(self.path).unlink(missing_ok=True)
+
+    def __enter__(self) -> "SharedFrame":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.unlink()
@@ -1,13 +1,72 @@
-import copy
+import threading
 import warnings
-from typing import Any
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple
 
+import numpy as np
 import pandas as pd
+import pandera as pa
 from smart_pandas.config.config_utils import read_config
 from smart_pandas.config.data_config import DataConfig
-from smart_pandas.state import State, StateName, StateError
-from smart_pandas.schema import build_schema
+from smart_pandas.config.watcher import ConfigWatcher, get_watcher
+from smart_pandas.state import MLStage, State, StateError, StateInferenceEngine, StateName
+from smart_pandas.registry import get_config, get_expected_dtypes, get_schema, register_config
+from smart_pandas.schema import find_null_columns, plan_validation
+from smart_pandas.sharing import AccessorState
 from smart_pandas.config.tag import TAGS
+from smart_pandas.executor import ValidationExecutor, get_default_executor
+from smart_pandas.feature_cache import FeatureCache, FeatureMatrices, data_fingerprint
+from smart_pandas.profiling import ColumnProfile, profile_columns
+from smart_pandas.group_index import GroupIndex
+from smart_pandas.time_index import TimeIndex
+from smart_pandas.uniqueness import BloomFilter, DuplicateReport, KeySet, find_duplicates
+
+if TYPE_CHECKING:
+    from smart_pandas.derived_features import DerivedFeatureEngine
+
+# Accessor attributes which require a loaded config, and trigger a state update when accessed
+DATA_ATTRIBUTES = [tag.data_attribute_name for tag in TAGS.values()]
+STATEFUL_ATTRIBUTES = [
+    "state",
+    "validate",
+    "find_duplicates",
+    "export_state",
+    "compute_derived_features",
+    "time_split",
+    "as_of",
+    "sliding_windows",
+    "expanding_windows",
+    "profile",
+    "cache_features",
+    "group_index",
+]
+
+
+class AccessorSnapshot(NamedTuple):
+    """
+    Immutable derived state of a SmartPandas accessor.
+
+    The accessor holds a single snapshot, which is replaced as a whole when the columns change, so concurrent
+    readers always see a consistent column hash, state, schema and indexers without taking a lock. The state
+    object is shared between snapshots and must not be modified.
+
+    Parameters
+    ----------
+    column_hash: int
+        Hash of the column labels the snapshot was built for.
+    state: State | None
+        The state of the data, None before a config is loaded.
+    schema: pa.DataFrameSchema | None
+        The validation schema of the state.
+    indexers: dict[str, np.ndarray | None]
+        Column positions of each data attribute compatible with the state. None if any of its columns are
+        missing, or the column labels are not unique.
+    """
+
+    column_hash: int
+    state: State | None
+    schema: pa.DataFrameSchema | None
+    indexers: dict[str, np.ndarray | None]
+
 
 @pd.api.extensions.register_dataframe_accessor("smart_pandas")
 class SmartPandas:
@@ -28,16 +87,50 @@ class SmartPandas:
         """
         self._obj = pandas_obj
         self.config: DataConfig | None = None
-        self.state: State | None = None
-        self.schema: object | None = None
         self.auto_update: bool = True
-        self.column_hash = hash(tuple(self._obj.columns))
+        self._snapshot = AccessorSnapshot(hash(tuple(self._obj.columns)), state=None, schema=None, indexers={})
+        # serialises snapshot rebuilds, readers never take it
+        self._lock = threading.Lock()
+        self._time_index: tuple[tuple, TimeIndex] | None = None
+        self._group_index: tuple[tuple, GroupIndex] | None = None
+        self._validation_key: tuple | None = None
+        self._watcher: ConfigWatcher | None = None
+
+    @property
+    def state(self) -> State | None:
+        """The state of the data, see `State`."""
+        return self._snapshot.state
+
+    @property
+    def schema(self) -> pa.DataFrameSchema | None:
+        """The validation schema of the current state."""
+        return self._snapshot.schema
+
+    @property
+    def column_hash(self) -> int:
+        """Hash of the column labels the state was inferred for."""
+        return self._snapshot.column_hash
+
+    def _build_snapshot(
+        self, config: DataConfig, column_hash: int, state: State, schema: pa.DataFrameSchema
+    ) -> AccessorSnapshot:
+        """Build a snapshot, resolving the column positions of the data attributes compatible with the state."""
+        columns = self._obj.columns
+        indexers = {}
+        if columns.is_unique:
+            for name in DATA_ATTRIBUTES:
+                if name in state.name.incompatibilities or name in state.ml_stage.incompatibilities:
+                    continue
+                positions = columns.get_indexer(getattr(config, name))
+                indexers[name] = None if (positions == -1).any() else positions
+        return AccessorSnapshot(column_hash, state=state, schema=schema, indexers=indexers)
 
     def load_config(
         self, 
         config_path: str | None = None, 
         config: DataConfig | None = None,
-        auto_update: bool = True
+        auto_update: bool = True,
+        watch: bool = False,
     ) -> None:
         """
         Load the configuration for the SmartPandas accessor, and update the state and schema.
@@ -50,66 +143,248 @@ class SmartPandas:
             DataConfig object to use directly
         auto_update : bool, default True
             Whether to automatically run update() after retrieving attributes
+        watch : bool, default False
+            Whether to switch to the new config when the file at config_path changes, see `ConfigWatcher`
 
         Raises
         ------
         ValueError
-            If neither config nor config_path is provided
+            If neither config nor config_path is provided, or watch is set without config_path
         TypeError
             If config is not a DataConfig instance
         """
         if config is None and config_path is None:
             raise ValueError("Either config or config_path must be provided")
 
-        if config is None:
+        watcher = None
+        if watch:
+            if config_path is None:
+                raise ValueError("config_path must be provided to watch the config")
+            watcher = get_watcher(config_path)
+            config = watcher.config
+        elif config is None:
             config = read_config(config_path)
+        else:
+            # the config may have been edited in place since it was last loaded
+            config._reset_fingerprint()
+
+        with self._lock:
+            column_hash = hash(tuple(self._obj.columns))
+            state = State.from_data(data=self._obj, config=config)
+            schema = get_schema(config, state)
+            self.config = config
+            self.name = self.config.name
+            self.auto_update = auto_update
+            self._watcher = watcher
+            self._snapshot = self._build_snapshot(config, column_hash, state, schema)
+
+    async def aload_config(
+        self,
+        config_path: str | None = None,
+        config: DataConfig | None = None,
+        auto_update: bool = True,
+        executor: ValidationExecutor | None = None,
+    ) -> None:
+        """
+        Asynchronous variant of `load_config`, which reads the config and builds the schema in an executor.
+
+        Parameters
+        ----------
+        config_path : str, optional
+            Path to the configuration YAML file
+        config : DataConfig, optional
+            DataConfig object to use directly
+        auto_update : bool, default True
+            Whether to automatically run update() after retrieving attributes
+        executor : ValidationExecutor, optional
+            Executor to run the blocking work in, defaults to the shared default executor
+        """
+        executor = executor or get_default_executor()
+        await executor.run(self.load_config, config_path=config_path, config=config, auto_update=auto_update)
+
+    def _inherit(self, source: "SmartPandas") -> None:
+        """Share the config, state and schema of an accessor on data with the same columns, without re-inferring them."""
+        self.config = source.config
+        self.name = source.name
+        self.auto_update = source.auto_update
+        self._watcher = source._watcher
+        # snapshots are immutable, so they can be shared between accessors
+        self._snapshot = source._snapshot
+
+    def export_state(self) -> AccessorState:
+        """
+        Export a compact, picklable snapshot of the accessor, see `restore_state`.
+
+        The config is registered in this process's config registry, so forked worker processes can resolve it.
+
+        Returns
+        -------
+        AccessorState
+            The accessor snapshot
+        """
+        register_config(self.config)
+        return AccessorState(
+            config_fingerprint=self.config.fingerprint,
+            state_name=self.state.name.value,
+            ml_stage=self.state.ml_stage.value,
+            auto_update=self.auto_update,
+            validated=self.is_validated,
+        )
+
+    def restore_state(self, accessor_state: AccessorState) -> None:
+        """
+        Initialize the accessor from an exported snapshot, without reading the config or re-inferring the state.
+
+        Parameters
+        ----------
+        accessor_state : AccessorState
+            A snapshot from `export_state` on data with the same columns
+
+        Raises
+        ------
+        KeyError
+            If the snapshot's config is not registered in this process
+        """
+        config = get_config(accessor_state.config_fingerprint)
+        state = State(StateName(accessor_state.state_name), MLStage(accessor_state.ml_stage))
+        with self._lock:
+            self.config = config
+            self.name = self.config.name
+            self.auto_update = accessor_state.auto_update
+            self._snapshot = self._build_snapshot(
+                config, hash(tuple(self._obj.columns)), state, get_schema(config, state)
+            )
+        if accessor_state.validated:
+            self._mark_validated()
+
+    @staticmethod
+    def _build_validation_key(config: DataConfig, state: State, column_hash: int) -> tuple:
+        return (config.fingerprint, state.name, state.ml_stage, column_hash)
 
-        self.config = config
-        self.name = self.config.name
-        self.auto_update = auto_update
-        self.state = State.from_data(data=self._obj, config=self.config)
-        self.schema = build_schema(self.config, self.state)
+    def _get_validation_key(self) -> tuple:
+        """Key identifying the config, state and columns the data is validated against."""
+        return self._build_validation_key(self.config, self.state, self.column_hash)
+
+    def _mark_validated(self) -> None:
+        """Record that the data has passed validation against the current config and state."""
+        self._validation_key = self._get_validation_key()
+
+    @property
+    def is_validated(self) -> bool:
+        """
+        Whether the data has passed `validate` under the current config, state and columns.
+
+        Only the columns are tracked, so changing values in place after validation is not detected.
+        """
+        if self.config is None or self._validation_key is None:
+            return False
+        return self._validation_key == self._get_validation_key()
 
     def update(self) -> None:
-        """Update SmartPandas properties if the datas column hash has changed."""
-        if hash(tuple(self._obj.columns)) != self.column_hash:
-            self.column_hash = hash(tuple(self._obj.columns))
-            self._update_state()
+        """
+        Update SmartPandas properties if the datas column hash has changed.
+
+        Unchanged columns only cost a hash comparison against the current snapshot. Otherwise the snapshot is
+        rebuilt under a lock, once per change of columns however many threads are reading.
+        """
+        column_hash = hash(tuple(self._obj.columns))
+        if column_hash != self._snapshot.column_hash:
+            with self._lock:
+                # another thread may have rebuilt the snapshot while this one waited for the lock
+                if column_hash != self._snapshot.column_hash:
+                    self._update_state(column_hash)
+
+    def _refresh_config(self) -> None:
+        """Switch to the latest version of the watched config, only rebuilding the parts its changes affect."""
+        config = self._watcher.config
+        if config is self.config:
+            return
+        with self._lock:
+            old_config = self.config
+            if config is old_config:
+                return
+            diff = self._watcher.diff_from(old_config)
+            snapshot = self._snapshot
+            # read the snapshot directly, as the stateful attributes would refresh the config again
+            was_validated = self._validation_key == self._build_validation_key(
+                old_config, snapshot.state, snapshot.column_hash
+            )
+
+            if diff.changed_data_attributes:
+                # the columns of some tags changed, so the state and column positions need to be resolved again
+                column_hash = hash(tuple(self._obj.columns))
+                state = State.from_data(data=self._obj, config=config)
+                snapshot = self._build_snapshot(config, column_hash, state, get_schema(config, state))
+            else:
+                snapshot = snapshot._replace(schema=get_schema(config, snapshot.state))
+
+            self.config = config
+            self.name = config.name
+            self._snapshot = snapshot
+            if was_validated and not diff.affects_state(config, snapshot.state):
+                self._validation_key = self._build_validation_key(config, snapshot.state, snapshot.column_hash)
 
     def _get_data_attribute(self, attr_name: str) -> pd.Series:
         """Get the data attribute of the SmartPandas accessor based on the config and the current state."""
-        if attr_name not in self.state.name.incompatibilities and attr_name not in self.state.ml_stage.incompatibilities:
-            return self._obj.loc[:, getattr(self.config, attr_name)]
-        else:
+        snapshot = self._snapshot
+        if attr_name in snapshot.state.name.incompatibilities or attr_name in snapshot.state.ml_stage.incompatibilities:
             return None
+        positions = snapshot.indexers.get(attr_name)
+        if positions is None:
+            return self._obj.loc[:, getattr(self.config, attr_name)]
+        return self._obj.iloc[:, positions]
 
-    def _update_state(self) -> None:
+    def _update_state(self, column_hash: int) -> None:
         """
         Update the state of the DataFrame based on the config and current data.
 
         If the state has changed, the schema will be updated to reflect the new state.
-        
-        Raises
-        ------
-        RuntimeError
-            If SmartPandas is not initialized
-        """            
-        old_state = copy.copy(self.state)
-        self.state.infer_state(data=self._obj, config=self.config)
 
-        if self.state.name in [StateName.CORRUPTED, StateName.UNKNOWN]:
+        Parameters
+        ----------
+        column_hash : int
+            Hash of the current column labels
+        """
+        old_state = self._snapshot.state
+        state = State(
+            StateInferenceEngine.infer_state_name(self._obj, self.config, old_state.ml_stage), old_state.ml_stage
+        )
+
+        if state.name in [StateName.CORRUPTED, StateName.UNKNOWN]:
+            self._snapshot = self._build_snapshot(self.config, column_hash, state, self._snapshot.schema)
             warnings.warn(
-                f"The state of the DataFrame has moved from {old_state.name.value} to {self.state.name.value}. "
+                f"The state of the DataFrame has moved from {old_state.name.value} to {state.name.value}. "
                 "Check your columns are correct.",
                 UserWarning,
             )
             return
-        if old_state != self.state:
-            self.schema = build_schema(self.config, self.state)
+        schema = self._snapshot.schema if state == old_state else get_schema(self.config, state)
+        self._snapshot = self._build_snapshot(self.config, column_hash, state, schema)
     
+    def _get_validation_schema(self, data: pd.DataFrame, **kwargs) -> pa.DataFrameSchema:
+        """
+        Get the schema for validating the data in place, with the cheap parts of the validation done up front.
+
+        The data's dtypes are compared to the schema in one vectorised comparison, so that only mismatched columns
+        are coerced, see `plan_validation`. Columns with exactly the expected NumPy dtype and no value checks are
+        checked for nulls with one vectorised test per column, and Pandera skips them. If any of them has nulls,
+        they are left to Pandera so it reports the failure.
+        """
+        if kwargs.keys() & {"head", "tail", "sample"}:
+            # Pandera only validates part of the data, so don't check all of it up front
+            return self.schema
+        plan = plan_validation(self.schema, get_expected_dtypes(self.config, self.state), data)
+        if plan is None:
+            return self.schema
+        non_nullable = [name for name in plan.fused_columns if not self.schema.columns[name].nullable]
+        if find_null_columns(data, non_nullable):
+            plan = plan._replace(fused_columns=frozenset())
+        return get_schema(self.config, self.state, plan=plan)
+
     def validate(
         self, 
         inplace: bool = False,
+        copy: bool = True,
         **kwargs
     ) -> pd.DataFrame:
         """
@@ -119,6 +394,11 @@ class SmartPandas:
         ----------
         inplace : bool, default False
             Whether to validate the DataFrame in place or return a new validated DataFrame
+        copy : bool, default True
+            Whether the returned DataFrame is a copy of the data. If False, it is a shallow copy which shares the
+            data of every column that already has the right dtype, and only the columns needing coercion are
+            copied. Without pandas copy-on-write, modifying its values in place also modifies this DataFrame.
+            Ignored if inplace=True.
         **kwargs
             Additional keyword arguments to pass to the Pandera schema validate method
 
@@ -141,23 +421,345 @@ class SmartPandas:
                 "Please check your data and try again."
             )
 
+        validated_data = self._obj if inplace else self._obj.copy(deep=copy)
+        self._get_validation_schema(validated_data, **kwargs).validate(validated_data, inplace=True, **kwargs)
         if inplace:
-            self.schema.validate(self._obj, inplace=inplace, **kwargs)
+            self._mark_validated()
             return None
 
-        validated_data = self.schema.validate(self._obj, inplace=inplace, **kwargs)
-        
-        # Re-initialize the config after overwriting the DataFrame object pointer
-        validated_data.smart_pandas.load_config(config=self.config)
+        # the columns are unchanged, so the accessor state is transferred rather than re-inferred
+        validated_data.smart_pandas._inherit(self)
+        validated_data.smart_pandas._mark_validated()
         return validated_data
 
+    async def avalidate(
+        self,
+        inplace: bool = False,
+        executor: ValidationExecutor | None = None,
+        **kwargs
+    ) -> pd.DataFrame:
+        """
+        Asynchronous variant of `validate`, which runs the validation in an executor.
+
+        The state is updated on the calling thread before the work is submitted, so the validation reuses
+        the schema cached for the current state. See `ValidationExecutor` for the concurrency and
+        cancellation behaviour.
+
+        Parameters
+        ----------
+        inplace : bool, default False
+            Whether to validate the DataFrame in place or return a new validated DataFrame
+        executor : ValidationExecutor, optional
+            Executor to run the validation in, defaults to the shared default executor
+        **kwargs
+            Additional keyword arguments to pass to the Pandera schema validate method
+
+        Returns
+        -------
+        pd.DataFrame or None
+            The validated DataFrame if inplace=False, None otherwise
+        """
+        validate = self.validate
+        executor = executor or get_default_executor()
+        return await executor.run(validate, inplace=inplace, **kwargs)
+
+    def find_duplicates(
+        self,
+        key_store: KeySet | BloomFilter | None = None,
+        update_store: bool = False,
+    ) -> DuplicateReport:
+        """
+        Find duplicated values of the unique identifier column.
+
+        Parameters
+        ----------
+        key_store : KeySet or BloomFilter, optional
+            Store of identifiers seen in previous batches, to also detect duplicates across batches
+        update_store : bool, default False
+            Whether to add this DataFrame's identifiers to the key store after checking
+
+        Returns
+        -------
+        DuplicateReport
+            Positions of the rows with duplicated identifiers
+        """
+        # the unique_identifier tag is limited to exactly one column
+        keys = self._obj[self.config.unique_identifier[0]]
+        return find_duplicates(keys, key_store=key_store, update_store=update_store)
+
+    def compute_derived_features(
+        self, engine: "DerivedFeatureEngine", features: list[str] | None = None
+    ) -> pd.DataFrame:
+        """
+        Compute the derived features missing from the DataFrame, see `DerivedFeatureEngine.compute`.
+
+        Parameters
+        ----------
+        engine : DerivedFeatureEngine
+            The engine with the registered derived feature functions
+        features : list[str], optional
+            The features to compute, defaults to every registered derived feature missing from the data
+
+        Returns
+        -------
+        pd.DataFrame
+            A new DataFrame with the features added, and its state updated once
+        """
+        return engine.compute(self._obj, features=features)
+
+    def _get_time_index(self) -> TimeIndex:
+        """
+        Get the time index of the row timestamp column.
+
+        The index is cached until the timestamp column is replaced or the number of rows changes. Timestamps
+        modified in place are not detected, assign the column again to rebuild the index.
+        """
+        key_arrays = self._get_key_arrays(self.config.row_timestamp)
+        cached = self._time_index
+        if cached is None or not self._same_arrays(cached[0], key_arrays):
+            # the row_timestamp tag is limited to exactly one column
+            cached = (key_arrays, TimeIndex(self._obj[self.config.row_timestamp[0]]))
+            self._time_index = cached
+        return cached[1]
+
+    def _get_key_arrays(self, columns: list[str]) -> tuple:
+        """The value arrays of the given columns, identifying their buffers for cache invalidation."""
+        arrays = []
+        for col in columns:
+            column = self._obj[col]
+            # NumPy columns are wrapped in a new array object on every access, so are compared by their buffer
+            arrays.append(column.to_numpy() if isinstance(column.dtype, np.dtype) else column.array)
+        return tuple(arrays)
+
+    @staticmethod
+    def _same_arrays(first: tuple, second: tuple) -> bool:
+        """Whether two tuples of column arrays hold the same buffers."""
+        return len(first) == len(second) and all(
+            a is b or (
+                isinstance(a, np.ndarray) and isinstance(b, np.ndarray)
+                and a.__array_interface__["data"] == b.__array_interface__["data"]
+                and a.strides == b.strides and a.shape == b.shape
+            )
+            for a, b in zip(first, second)
+        )
+
+    def group_index(self, rebuild: bool = False) -> GroupIndex:
+        """
+        Get the index of the entity groups of the unique identifier, sorted within each group by the row timestamp.
+
+        The index is cached until the unique identifier or row timestamp columns are replaced or the number of rows
+        changes, so adding feature columns keeps it. Call with rebuild=True after changing key values in place.
+
+        Parameters
+        ----------
+        rebuild : bool, default False
+            Whether to rebuild the index even if it is cached
+
+        Returns
+        -------
+        GroupIndex
+            The group index, see `GroupIndex.transform`, `GroupIndex.lag` and `GroupIndex.rolling`
+        """
+        key_arrays = self._get_key_arrays([*self.config.unique_identifier, *self.config.row_timestamp])
+        cached = self._group_index
+        if rebuild or cached is None or not self._same_arrays(cached[0], key_arrays):
+            # the cached arrays keep the key buffers alive, so a new column can't reuse their address
+            cached = (key_arrays, GroupIndex(
+                self._obj[self.config.unique_identifier[0]], self._obj[self.config.row_timestamp[0]]
+            ))
+            self._group_index = cached
+        return cached[1]
+
+    def _take_time_range(self, lo: int, hi: int) -> pd.DataFrame:
+        """Select rows by sorted timestamp position, keeping the config and state of this accessor."""
+        data = self._get_time_index().take(self._obj, lo, hi)
+        data.smart_pandas._inherit(self)
+        return data
+
+    def time_split(self, *cutoffs) -> list[pd.DataFrame]:
+        """
+        Split the DataFrame into consecutive time periods based on the row timestamp.
+
+        Parameters
+        ----------
+        *cutoffs : timestamp-like
+            Increasing cutoffs, each one is the inclusive start of the next period
+
+        Returns
+        -------
+        list[pd.DataFrame]
+            len(cutoffs) + 1 DataFrames, covering [-inf, cutoffs[0]), [cutoffs[0], cutoffs[1]), ..., [cutoffs[-1], inf)
+        """
+        bounds = [None, *cutoffs, None]
+        if any(pd.Timestamp(a) > pd.Timestamp(b) for a, b in zip(cutoffs, cutoffs[1:])):
+            raise ValueError("cutoffs must be in increasing order")
+        time_index = self._get_time_index()
+        return [
+            self._take_time_range(*time_index.positions(start, end))
+            for start, end in zip(bounds, bounds[1:])
+        ]
+
+    def as_of(self, cutoff, inclusive: bool = True) -> pd.DataFrame:
+        """
+        Select the rows with a row timestamp up to the cutoff.
+
+        Parameters
+        ----------
+        cutoff : timestamp-like
+            The cutoff timestamp
+        inclusive : bool, default True
+            Whether rows at exactly the cutoff are included
+
+        Returns
+        -------
+        pd.DataFrame
+            The selected rows
+        """
+        return self._take_time_range(*self._get_time_index().positions(end=cutoff, inclusive_end=inclusive))
+
+    def sliding_windows(self, window, step=None, start=None, end=None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over fixed length time windows of the DataFrame based on the row timestamp.
+
+        Parameters
+        ----------
+        window : timedelta-like
+            The length of each window, windows cover [window_start, window_start + window)
+        step : timedelta-like, optional
+            The offset between consecutive window starts, defaults to window
+        start : timestamp-like, optional
+            The start of the first window, defaults to the earliest timestamp
+        end : timestamp-like, optional
+            Windows starting at or after end are not generated, defaults to the latest timestamp
+
+        Yields
+        ------
+        pd.DataFrame
+            The rows in each window
+        """
+        for lo, hi in self._get_time_index().sliding_windows(window, step=step, start=start, end=end):
+            yield self._take_time_range(lo, hi)
+
+    def expanding_windows(self, step, start=None, end=None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over time windows with a fixed start and a growing end, based on the row timestamp.
+
+        Parameters
+        ----------
+        step : timedelta-like
+            The amount the window end grows by each time, windows cover [start, start + k * step)
+        start : timestamp-like, optional
+            The start of every window, defaults to the earliest timestamp
+        end : timestamp-like, optional
+            The last window is the first one to reach past end, defaults to the latest timestamp
+
+        Yields
+        ------
+        pd.DataFrame
+            The rows in each window
+        """
+        for lo, hi in self._get_time_index().expanding_windows(step, start=start, end=end):
+            yield self._take_time_range(lo, hi)
+
+    def profile(self, data_attributes: tuple[str, ...] = ("model_features", "target")) -> dict[str, ColumnProfile]:
+        """
+        Compute mergeable summary statistics of the columns in the given tag groups.
+
+        The numeric columns of each group are profiled in a single vectorised pass. Profiles of different chunks
+        can be combined with `smart_pandas.profiling.merge_profiles`, and serialised with `ColumnProfile.to_dict`.
+
+        Parameters
+        ----------
+        data_attributes : tuple[str, ...], default ("model_features", "target")
+            The tag data attributes to profile, groups incompatible with the current state are skipped
+
+        Returns
+        -------
+        dict[str, ColumnProfile]
+            The profile of each column
+        """
+        unknown = [name for name in data_attributes if name not in DATA_ATTRIBUTES]
+        if unknown:
+            raise ValueError(f"Unknown data attributes {unknown}, expected any of {DATA_ATTRIBUTES}")
+
+        profiles = {}
+        for name in data_attributes:
+            if name in self.state.name.incompatibilities or name in self.state.ml_stage.incompatibilities:
+                continue
+            columns = [col for col in getattr(self.config, name) if col not in profiles]
+            profiles.update(profile_columns(self._obj, columns))
+        return profiles
+
+    def cache_features(
+        self,
+        cache: FeatureCache | str,
+        data_attributes: tuple[str, ...] = ("model_features", "target", "weight"),
+        data_key: str | None = None,
+    ) -> FeatureMatrices:
+        """
+        Get the validated arrays of tag groups from a memory mapped cache, writing them on the first call.
+
+        Entries are keyed by the content of the data, the config fingerprint and the state, so repeated runs on
+        the same data, in this or other processes, map the arrays written by the first run without validating or
+        extracting them again. Data which has not been validated is validated without a copy before writing.
+
+        Parameters
+        ----------
+        cache : FeatureCache or str
+            The cache, or the directory of one
+        data_attributes : tuple[str, ...], default ("model_features", "target", "weight")
+            The tag data attributes to cache, groups incompatible with the current state or without columns are
+            skipped
+        data_key : str, optional
+            Identifies the content of the data, e.g. a path and version of the source file. Defaults to a
+            fingerprint of the cached columns, which costs one hashing pass over them.
+
+        Returns
+        -------
+        FeatureMatrices
+            The read-only arrays and their cache key
+
+        Raises
+        ------
+        ValueError
+            If a data attribute is unknown or any of the cached columns are not numeric
+        """
+        unknown = [name for name in data_attributes if name not in DATA_ATTRIBUTES]
+        if unknown:
+            raise ValueError(f"Unknown data attributes {unknown}, expected any of {DATA_ATTRIBUTES}")
+        if isinstance(cache, str):
+            cache = FeatureCache(cache)
+
+        state = self.state
+        attributes = [
+            name for name in data_attributes
+            if name not in state.name.incompatibilities and name not in state.ml_stage.incompatibilities
+            and getattr(self.config, name)
+        ]
+        if data_key is None:
+            data_key = data_fingerprint(self._obj, [col for name in attributes for col in getattr(self.config, name)])
+        key = cache.build_key(data_key, self.config, state, attributes)
+        matrices = cache.load(key)
+        if matrices is not None:
+            return matrices
+
+        data = self._obj if self.is_validated else self.validate(copy=False)
+        frames = {name: getattr(data.smart_pandas, name) for name in attributes}
+        flatten = tuple(
+            tag.data_attribute_name for tag in TAGS.values()
+            if tag.config_limit[1] == 1 and tag.data_attribute_name in frames
+        )
+        return cache.store(key, frames, flatten=flatten)
+
     def __getattribute__(self, name: str) -> Any:
         """Custom getter to allow validating and updating state before accessing data attributes."""
-        if name in [tag.data_attribute_name for tag in TAGS.values()] + ["state", "validate"]:
+        if name in DATA_ATTRIBUTES or name in STATEFUL_ATTRIBUTES:
             if self.config is None:
                 raise RuntimeError("SmartPandas not initialized. Call data.smart_pandas.load_config() first.")
+            if self._watcher is not None:
+                self._refresh_config()
             if self.auto_update:
                 self.update()
-            if name not in ["state", "validate"]:
+            if name in DATA_ATTRIBUTES:
                 return self._get_data_attribute(name)
         return super().__getattribute__(name)
@@ -166,6 +166,25 @@ class State:
         state_name = inference_engine.infer_state_name(data, config, ml_stage)
         return cls(state_name, ml_stage)
 
+    @classmethod
+    def from_columns(cls, columns: list[str], config: "DataConfig") -> "State":
+        """
+        Create a State instance by inferring from column names, e.g. from a file schema without reading any data.
+
+        Parameters
+        ----------
+        columns : list[str]
+            The column names of the data
+        config : DataConfig
+            The configuration object
+
+        Returns
+        -------
+        State
+            The inferred state
+        """
+        return cls.from_data(data=pd.DataFrame(columns=list(columns)), config=config)
+
     def infer_state(self, data: pd.DataFrame, config: "DataConfig") -> None:
         """
         Update the state based on current data and configuration.
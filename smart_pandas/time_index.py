@@ -0,0 +1,136 @@
+from typing import Iterator
+
+import numpy as np
+import pandas as pd
+
+
+class TimeIndex:
+    """
+    Sorted view of a timestamp column, used for time based slicing without boolean masks.
+
+    If the timestamps are already sorted, slices are positional ranges of the original data and are returned as
+    views. Otherwise a stable sort permutation is computed once, and slices take only the selected rows. Rows with
+    a NaT timestamp are in no range.
+    """
+
+    def __init__(self, timestamps: pd.Series):
+        """
+        Initialize the time index.
+
+        Parameters
+        ----------
+        timestamps : pd.Series
+            The timestamp column to index
+        """
+        values = timestamps.array
+        if timestamps.is_monotonic_increasing:
+            self.order: np.ndarray | None = None
+            self.sorted_values = values
+        else:
+            order = values.argsort(kind="stable")
+            # NaT timestamps are sorted last, and are excluded from every range
+            self.order = order[:len(order) - int(timestamps.isna().sum())]
+            self.sorted_values = values.take(self.order)
+
+    def __len__(self) -> int:
+        return len(self.sorted_values)
+
+    @property
+    def is_sorted(self) -> bool:
+        """Whether the indexed timestamps are already in increasing order."""
+        return self.order is None
+
+    def positions(self, start=None, end=None, inclusive_end: bool = False) -> tuple[int, int]:
+        """
+        Get the positions in sorted order of timestamps between start and end.
+
+        Parameters
+        ----------
+        start : timestamp-like, optional
+            Inclusive lower bound, unbounded if None
+        end : timestamp-like, optional
+            Upper bound, unbounded if None
+        inclusive_end : bool, default False
+            Whether the upper bound is inclusive
+
+        Returns
+        -------
+        tuple[int, int]
+            The start and stop positions of the matching range
+        """
+        lo = 0 if start is None else int(self.sorted_values.searchsorted(pd.Timestamp(start), side="left"))
+        if end is None:
+            hi = len(self)
+        else:
+            hi = int(self.sorted_values.searchsorted(pd.Timestamp(end), side="right" if inclusive_end else "left"))
+        return lo, max(lo, hi)
+
+    def take(self, data: pd.DataFrame, lo: int, hi: int) -> pd.DataFrame:
+        """Select the rows at sorted positions lo to hi, keeping their original relative order."""
+        if self.order is None:
+            return data.iloc[lo:hi]
+        return data.iloc[np.sort(self.order[lo:hi])]
+
+    def sliding_windows(self, window, step=None, start=None, end=None) -> Iterator[tuple[int, int]]:
+        """
+        Generate sorted position ranges of fixed length time windows.
+
+        Parameters
+        ----------
+        window : timedelta-like
+            The length of each window, windows cover [window_start, window_start + window)
+        step : timedelta-like, optional
+            The offset between consecutive window starts, defaults to window
+        start : timestamp-like, optional
+            The start of the first window, defaults to the earliest timestamp
+        end : timestamp-like, optional
+            Windows starting at or after end are not generated, defaults to the latest timestamp
+
+        Yields
+        ------
+        tuple[int, int]
+            The start and stop positions of each window
+        """
+        window = pd.Timedelta(window)
+        step = window if step is None else pd.Timedelta(step)
+        if step <= pd.Timedelta(0):
+            raise ValueError("step must be a positive duration")
+        if len(self) == 0:
+            return
+        window_start = pd.Timestamp(self.sorted_values[0] if start is None else start)
+        end = pd.Timestamp(self.sorted_values[-1] if end is None else end)
+        while window_start <= end:
+            yield self.positions(window_start, window_start + window)
+            window_start += step
+
+    def expanding_windows(self, step, start=None, end=None) -> Iterator[tuple[int, int]]:
+        """
+        Generate sorted position ranges of windows with a fixed start and a growing end.
+
+        Parameters
+        ----------
+        step : timedelta-like
+            The amount the window end grows by each time, windows cover [start, start + k * step)
+        start : timestamp-like, optional
+            The start of every window, defaults to the earliest timestamp
+        end : timestamp-like, optional
+            The last window is the first one to reach past end, defaults to the latest timestamp
+
+        Yields
+        ------
+        tuple[int, int]
+            The start and stop positions of each window
+        """
+        step = pd.Timedelta(step)
+        if step <= pd.Timedelta(0):
+            raise ValueError("step must be a positive duration")
+        if len(self) == 0:
+            return
+        start = pd.Timestamp(self.sorted_values[0] if start is None else start)
+        end = pd.Timestamp(self.sorted_values[-1] if end is None else end)
+        window_end = start + step
+        while True:
+            yield self.positions(start, window_end)
+            if window_end > end:
+                break
+            window_end += step
@@ -0,0 +1,254 @@
+import math
+import os
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+
+def hash_keys(keys: pd.DataFrame | pd.Series) -> np.ndarray:
+    """
+    Hash each row of the key columns to a single uint64 value.
+
+    Parameters
+    ----------
+    keys : pd.DataFrame or pd.Series
+        The key column(s) to hash
+
+    Returns
+    -------
+    np.ndarray
+        Array of uint64 hashes, one per row
+    """
+    return pd.util.hash_pandas_object(keys, index=False).to_numpy()
+
+
+def find_duplicate_positions(keys: pd.DataFrame | pd.Series) -> np.ndarray:
+    """
+    Find the positions of rows whose key has already appeared earlier in the data.
+
+    Keys are factorized with a hash table in a single pass, and since factorized codes are assigned in order of
+    first appearance, a row is a first occurrence exactly when its code exceeds every code before it. Null keys
+    are never reported as duplicates.
+
+    Parameters
+    ----------
+    keys : pd.DataFrame or pd.Series
+        The key column(s) to check
+
+    Returns
+    -------
+    np.ndarray
+        Sorted integer positions of the duplicated rows, excluding the first occurrence of each key
+    """
+    if isinstance(keys, pd.DataFrame):
+        keys = keys.iloc[:, 0] if keys.shape[1] == 1 else pd.Series(hash_keys(keys))
+
+    codes, uniques = pd.factorize(keys)
+    if len(uniques) == np.count_nonzero(codes != -1):
+        return np.empty(0, dtype=np.intp)
+
+    previous_max = np.empty_like(codes)
+    previous_max[:1] = -1
+    np.maximum.accumulate(codes[:-1], out=previous_max[1:])
+    return np.flatnonzero((codes <= previous_max) & (codes != -1))
+
+
+class KeySet:
+    """
+    Exact, persistent set of hashed keys, used for detecting duplicate keys across batches.
+
+    Keys are stored as a sorted array of uint64 hashes, so membership is a binary search and adding a batch is a
+    sorted merge. The set can be saved to and loaded from a `.npy` file.
+    """
+
+    def __init__(self, keys: np.ndarray | None = None):
+        """
+        Initialize the key set.
+
+        Parameters
+        ----------
+        keys : np.ndarray, optional
+            Initial uint64 key hashes
+        """
+        self._keys = np.unique(np.asarray(keys, dtype=np.uint64)) if keys is not None else np.empty(0, dtype=np.uint64)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of which hashes are in the set."""
+        positions = np.searchsorted(self._keys, hashes)
+        found = positions < len(self._keys)
+        found[found] = self._keys[positions[found]] == hashes[found]
+        return found
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes to the set."""
+        self._keys = np.union1d(self._keys, np.asarray(hashes, dtype=np.uint64))
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the set to a `.npy` file."""
+        _atomic_write(path, lambda stream: np.save(stream, self._keys))
+
+    @classmethod
+    def load(cls, path: str | Path) -> "KeySet":
+        """Load a set from a `.npy` file, returning an empty set if the file does not exist."""
+        key_set = cls()
+        if Path(path).exists():
+            key_set._keys = np.load(path)
+        return key_set
+
+
+class BloomFilter:
+    """
+    Bloom filter over hashed keys, used for detecting duplicate keys across batches in bounded memory.
+
+    Membership tests can return false positives at roughly the configured rate once `capacity` keys have been
+    added, but never false negatives.
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float = 0.01):
+        """
+        Initialize an empty Bloom filter.
+
+        Parameters
+        ----------
+        capacity : int
+            The number of keys the filter is sized for
+        false_positive_rate : float, default 0.01
+            The target false positive rate at capacity
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+
+    def _bit_positions(self, hashes: np.ndarray) -> np.ndarray:
+        """Derive `num_hashes` bit positions per key with double hashing."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        with np.errstate(over="ignore"):
+            # splitmix64 finaliser gives an independent second hash
+            h2 = hashes ^ (hashes >> np.uint64(30))
+            h2 = h2 * np.uint64(0xBF58476D1CE4E5B9)
+            h2 = h2 ^ (h2 >> np.uint64(27))
+            h2 = (h2 * np.uint64(0x94D049BB133111EB)) | np.uint64(1)
+            steps = np.arange(self.num_hashes, dtype=np.uint64)
+            positions = hashes[:, None] + steps[None, :] * h2[:, None]
+        return positions % np.uint64(self.num_bits)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Return a boolean mask of which hashes may be in the filter."""
+        positions = self._bit_positions(hashes)
+        bits = (self._bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def add(self, hashes: np.ndarray) -> None:
+        """Add hashes to the filter."""
+        positions = self._bit_positions(hashes).ravel()
+        masks = np.left_shift(1, (positions & np.uint64(7)).astype(np.uint8)).astype(np.uint8)
+        np.bitwise_or.at(self._bits, (positions >> np.uint64(3)).astype(np.intp), masks)
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the filter to a `.npz` file."""
+        _atomic_write(
+            path,
+            lambda stream: np.savez(
+                stream,
+                bits=self._bits,
+                params=np.array([self.capacity, self.false_positive_rate, self.num_bits, self.num_hashes]),
+            ),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "BloomFilter":
+        """Load a filter from a `.npz` file."""
+        with np.load(path) as stored:
+            capacity, false_positive_rate, num_bits, num_hashes = stored["params"]
+            bloom_filter = cls(int(capacity), float(false_positive_rate))
+            bloom_filter.num_bits, bloom_filter.num_hashes = int(num_bits), int(num_hashes)
+            bloom_filter._bits = stored["bits"]
+        return bloom_filter
+
+
+class DuplicateKeyError(ValueError):
+    """Raised when values of a column that must be unique are duplicated."""
+
+    def __init__(self, column_name: str, positions: np.ndarray):
+        self.column_name = column_name
+        self.positions = positions
+        super().__init__(
+            f"Column '{column_name}' has {len(positions)} duplicated value(s), first at position(s) "
+            f"{positions[:5].tolist()}"
+        )
+
+
+class DuplicateReport(NamedTuple):
+    """
+    Positions of rows with duplicated keys.
+
+    Parameters
+    ----------
+    within_batch: np.ndarray
+        Positions of rows whose key already appeared earlier in the same data.
+    across_batches: np.ndarray
+        Positions of rows whose key is in the key store from previous batches. With a BloomFilter store these may
+        include false positives.
+    """
+
+    within_batch: np.ndarray
+    across_batches: np.ndarray
+
+    @property
+    def has_duplicates(self) -> bool:
+        return len(self.within_batch) > 0 or len(self.across_batches) > 0
+
+
+def find_duplicates(
+    keys: pd.DataFrame | pd.Series,
+    key_store: KeySet | BloomFilter | None = None,
+    update_store: bool = False,
+) -> DuplicateReport:
+    """
+    Find duplicated keys within the data, and optionally against keys seen in previous batches.
+
+    Parameters
+    ----------
+    keys : pd.DataFrame or pd.Series
+        The key column(s) to check
+    key_store : KeySet or BloomFilter, optional
+        Store of keys from previous batches
+    update_store : bool, default False
+        Whether to add this batch's keys to the key store after checking. Null keys are never added.
+
+    Returns
+    -------
+    DuplicateReport
+        Positions of the duplicated rows
+    """
+    within_batch = find_duplicate_positions(keys)
+    across_batches = np.empty(0, dtype=np.intp)
+    if key_store is not None:
+        # null keys are never duplicates, so they are neither checked against nor added to the store
+        non_null = keys.notna().to_numpy() if isinstance(keys, pd.Series) else keys.notna().all(axis=1).to_numpy()
+        positions = np.flatnonzero(non_null)
+        hashes = hash_keys(keys.iloc[positions])
+        across_batches = positions[key_store.contains(hashes)]
+        if update_store:
+            key_store.add(hashes)
+    return DuplicateReport(within_batch=within_batch, across_batches=across_batches)
+
+
+def _atomic_write(path: str | Path, write) -> None:
+    """Write a file via a temporary file in the same directory, so readers never see a partial file."""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as stream:
+        write(stream)
+    os.replace(tmp_path, path)
@@ -0,0 +1,123 @@
+import pandas as pd
+import pandera as pa
+import pytest
+
+import smart_pandas
+from smart_pandas.batch import _is_row_wise
+from smart_pandas.config.config_utils import read_yaml
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.state import StateError
+from smart_pandas.uniqueness import DuplicateKeyError
+
+
+@pytest.fixture()
+def validated_batches(smart_data_raw):
+    batches = []
+    for day in range(3):
+        batch = smart_data_raw.copy()
+        batch["user_id"] = [f"{day}-{i}" for i in range(len(batch))]
+        batch.smart_pandas.load_config(config=smart_data_raw.smart_pandas.config)
+        batches.append(batch.smart_pandas.validate())
+    return batches
+
+
+def test_validate_marks_validated(smart_data_raw):
+    assert not smart_data_raw.smart_pandas.is_validated
+    assert smart_data_raw.smart_pandas.validate().smart_pandas.is_validated
+
+    smart_data_raw.smart_pandas.validate(inplace=True)
+    assert smart_data_raw.smart_pandas.is_validated
+    smart_data_raw.loc[:, "bmi"] = 1.0
+    assert not smart_data_raw.smart_pandas.is_validated
+
+
+def test_concat(validated_batches):
+    result = smart_pandas.concat(validated_batches, ignore_index=True)
+
+    assert len(result) == 9
+    assert result.smart_pandas.is_validated
+    assert result.smart_pandas.state == validated_batches[0].smart_pandas.state
+    pd.testing.assert_frame_equal(result, result.smart_pandas.validate())
+
+
+def test_concat_requires_validation(validated_batches, smart_data_raw):
+    with pytest.raises(ValueError, match="has not been validated"):
+        smart_pandas.concat([*validated_batches, smart_data_raw])
+
+
+def test_concat_requires_same_state(validated_batches, smart_data_processed):
+    with pytest.raises(StateError):
+        smart_pandas.concat([*validated_batches, smart_data_processed.smart_pandas.validate()])
+
+
+def test_concat_duplicate_identifiers(validated_batches):
+    with pytest.raises(DuplicateKeyError, match="user_id"):
+        smart_pandas.concat([validated_batches[0], validated_batches[0]])
+
+
+def test_validate_many(smart_data_raw, smart_data_processed):
+    config = smart_data_raw.smart_pandas.config
+    frames = [smart_data_raw.copy() for _ in range(3)] + [smart_data_processed.copy()]
+    # the invalid frame has the same layout as frame 2, so their combined validation fails and falls back
+    frames[1] = frames[1].assign(weight=["a", "b", "c"])
+    frames[2] = frames[2].assign(weight=["78", "74", "80"])
+
+    result = smart_pandas.validate_many(frames, config)
+
+    assert not result.is_valid
+    assert list(result.errors) == [1] and result.frames[1] is None
+    for position in [0, 2, 3]:
+        validated = result.frames[position]
+        assert validated.smart_pandas.is_validated
+        frames[position].smart_pandas.load_config(config=config)
+        pd.testing.assert_frame_equal(validated, frames[position].smart_pandas.validate())
+    assert result.frames[3].smart_pandas.state == smart_data_processed.smart_pandas.state
+
+
+def test_validate_many_unique_columns_validated_per_frame(smart_data_raw):
+    schema = smart_data_raw.smart_pandas.schema
+    assert _is_row_wise(schema)
+    assert _is_row_wise(schema.update_column("weight", checks=[pa.Check.ge(0)]))
+    assert not _is_row_wise(schema.update_column("user_id", unique=True))
+    assert not _is_row_wise(schema.update_column("weight", checks=[pa.Check(lambda s: s.mean() > 0)]))
+
+
+def test_validate_many_sampling_validates_per_frame(smart_data_raw, monkeypatch):
+    config = smart_data_raw.smart_pandas.config
+    frames = [smart_data_raw.copy() for _ in range(3)]
+    # head of the combined frame would only check rows of the first frame
+    monkeypatch.setattr(smart_pandas.batch, "_validate_combined", lambda *args, **kwargs: pytest.fail("combined"))
+
+    result = smart_pandas.validate_many(frames, config, head=1)
+    assert result.is_valid and all(frame.smart_pandas.is_validated for frame in result.frames)
+
+    with pytest.raises(ValueError, match="inplace is not supported"):
+        smart_pandas.validate_many(frames, config, inplace=True)
+
+
+def test_concat_revalidates_column_checks(smart_data_raw):
+    config = read_yaml("tests/example_configs/example_config.yaml")
+    config["columns"][3]["data_schema"] = pa.Column(float, checks=[pa.Check(lambda s: s.sum() < 500)])
+    config = DataConfig(**config)
+    batches = []
+    for day in range(3):
+        batch = smart_data_raw.copy()
+        batch["user_id"] = [f"{day}-{i}" for i in range(len(batch))]
+        batch.smart_pandas.load_config(config=config)
+        batches.append(batch.smart_pandas.validate())
+
+    # each batch passes the check, but their combined weights don't
+    with pytest.raises(pa.errors.SchemaError):
+        smart_pandas.concat(batches)
+
+
+def test_validate_many_records_state_errors(smart_data_raw):
+    config = smart_data_raw.smart_pandas.config
+    # missing the unique identifier makes the state corrupted, missing a raw feature makes it unknown
+    corrupted = [smart_data_raw.drop(columns="user_id") for _ in range(2)]
+    unknown = [smart_data_raw.drop(columns="weight") for _ in range(2)]
+
+    result = smart_pandas.validate_many([*corrupted, *unknown], config)
+
+    assert sorted(result.errors) == [0, 1, 2, 3]
+    assert isinstance(result.errors[0], ValueError) and isinstance(result.errors[2], StateError)
@@ -1,4 +1,9 @@
-from smart_pandas.config.config_utils import read_config
+import json
+
+import pandera as pa
+
+from smart_pandas.config.config_utils import read_config, read_yaml
+from smart_pandas.config.data_config import DataConfig
 
 
 def test_config_attributes():
@@ -11,3 +16,62 @@ def test_config_attributes():
     assert config.unique_identifier == ["user_id"]
     assert config.metadata == ["name"]
     assert config.row_timestamp == ["timestamp"]
+
+
+def test_json_config_matches_yaml(tmp_path):
+    config = read_config("tests/example_configs/example_config.yaml")
+    json_path = tmp_path / "config.json"
+    json_path.write_text(json.dumps(read_yaml("tests/example_configs/example_config.yaml")))
+
+    json_config = read_config(str(json_path))
+    assert json_config.fingerprint == config.fingerprint
+    assert json_config.model_features == config.model_features
+
+
+def test_columns_from_identical_schemas_are_independent():
+    config = read_config("tests/example_configs/example_config.yaml")
+    other = read_config("tests/example_configs/example_config.yaml")
+    columns = {column.name: column for column in config.columns}
+    other_columns = {column.name: column for column in other.columns}
+
+    assert columns["weight"].data_schema.properties == columns["height"].data_schema.properties
+    assert columns["age"].data_schema.dtype != columns["weight"].data_schema.dtype
+    assert columns["bmi"].model_feature and not columns["bmi"].raw_feature
+
+    columns["weight"].data_schema.nullable = True
+    columns["weight"].tags.tags.append(columns["bmi"].tags.tags[0])
+    assert not columns["height"].data_schema.nullable and not other_columns["weight"].data_schema.nullable
+    assert len(columns["height"].tags.tags) == len(other_columns["weight"].tags.tags) == 1
+
+
+def test_columns_with_different_check_closures_are_not_shared():
+    def above(threshold):
+        return pa.Check(lambda s: s > threshold)
+
+    definition = read_yaml("tests/example_configs/example_config.yaml")
+    configs = []
+    for threshold in [0, 1]:
+        definition["columns"][3]["data_schema"] = {"dtype": "float", "checks": [above(threshold)]}
+        configs.append(DataConfig(**definition))
+
+    assert configs[0].fingerprint != configs[1].fingerprint
+    assert configs[0].columns.columns[3].data_schema.checks[0] is not configs[1].columns.columns[3].data_schema.checks[0]
+
+
+def _config_with_check(check: pa.Check) -> DataConfig:
+    config = read_yaml("tests/example_configs/example_config.yaml")
+    config["columns"][3]["data_schema"] = pa.Column(float, checks=[check])
+    return DataConfig(**config)
+
+
+def test_fingerprint_identifies_custom_checks():
+    positive = _config_with_check(pa.Check(lambda s: s > 0))
+    negative = _config_with_check(pa.Check(lambda s: s < 0))
+
+    def above(threshold):
+        return pa.Check(lambda s: s > threshold)
+
+    assert positive.fingerprint != negative.fingerprint
+    assert _config_with_check(pa.Check(lambda s: s > 0)).fingerprint == positive.fingerprint
+    assert _config_with_check(above(0)).fingerprint != _config_with_check(above(1)).fingerprint
+    assert _config_with_check(pa.Check.gt(0)).fingerprint != _config_with_check(pa.Check.gt(1)).fingerprint
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from smart_pandas.state import MLStage, State, StateName
+
+pytest.importorskip("pyarrow")
+import smart_pandas.dataset  # noqa: E402
+from smart_pandas.dataset import SmartDataset  # noqa: E402
+
+
+@pytest.fixture()
+def parquet_dir(smart_data_processed, tmp_path):
+    data = pd.concat([smart_data_processed] * 2, ignore_index=True)
+    data["user_id"] = [str(i) for i in range(len(data))]
+    data["timestamp"] = pd.date_range("2020-01-01", periods=len(data), freq="D")
+    data.iloc[:3].to_parquet(tmp_path / "part-0.parquet", index=False)
+    data.iloc[3:].to_parquet(tmp_path / "part-1.parquet", index=False)
+    return tmp_path
+
+
+def test_dataset_state(parquet_dir):
+    dataset = SmartDataset(str(parquet_dir / "*.parquet"), config_path="tests/example_configs/example_config.yaml")
+
+    assert dataset.state == State(name=StateName.PROCESSED, ml_stage=MLStage.TRAINING)
+    assert dataset.model_features.columns == ["age", "bmi"]
+
+
+def test_dataset_projection(parquet_dir, smart_data_processed):
+    dataset = SmartDataset(str(parquet_dir), config=smart_data_processed.smart_pandas.config, partitioning=None)
+
+    features = dataset.model_features.between(start="2020-01-02", end="2020-01-05").to_pandas()
+    assert list(features.columns) == ["age", "bmi"]
+    assert len(features) == 3
+    assert sum(len(batch) for batch in dataset.target.iter_batches(batch_size=2)) == 6
+
+
+def test_dataset_partitions(parquet_dir, smart_data_processed):
+    dataset = SmartDataset(str(parquet_dir), config=smart_data_processed.smart_pandas.config, partitioning=None)
+
+    partitions = list(dataset.iter_partitions(max_workers=2))
+    assert [len(partition) for partition in partitions] == [3, 3]
+    assert partitions[0].smart_pandas.state == dataset.state
+    assert dataset.validate() == {}
+    assert dataset.to_pandas(end="2020-01-03").smart_pandas.state == dataset.state
+
+
+def test_dataset_partitions_read_ahead_is_bounded(parquet_dir, smart_data_processed, monkeypatch):
+    for part in range(2, 6):
+        pd.read_parquet(parquet_dir / "part-0.parquet").to_parquet(parquet_dir / f"part-{part}.parquet", index=False)
+    dataset = SmartDataset(str(parquet_dir), config=smart_data_processed.smart_pandas.config, partitioning=None)
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            submitted.append(args)
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(smart_pandas.dataset, "ThreadPoolExecutor", RecordingExecutor)
+    partitions = dataset.iter_partitions(max_workers=2)
+
+    next(partitions)
+    assert len(submitted) == 3
+    assert sum(1 for _ in partitions) == 5 and len(submitted) == 6
+
+
+def test_dataset_validation_errors(parquet_dir, smart_data_processed):
+    pd.read_parquet(parquet_dir / "part-1.parquet").assign(age="old").to_parquet(
+        parquet_dir / "part-1.parquet", index=False
+    )
+    dataset = SmartDataset(str(parquet_dir), config=smart_data_processed.smart_pandas.config, partitioning=None)
+
+    errors = dataset.validate(max_workers=2)
+    assert list(errors) == [str(parquet_dir / "part-1.parquet")]
+
+
+def test_dataset_hive_partitions(smart_data_processed, tmp_path):
+    data = pd.concat([smart_data_processed] * 2, ignore_index=True)
+    data["user_id"] = [str(i) for i in range(len(data))]
+    data["timestamp"] = pd.date_range("2020-01-01", periods=len(data), freq="D")
+    for date, partition in data.groupby(data["timestamp"].dt.strftime("%Y-%m-%d")):
+        (tmp_path / f"date={date}").mkdir()
+        partition.to_parquet(tmp_path / f"date={date}" / "part-0.parquet", index=False)
+
+    dataset = SmartDataset(str(tmp_path), config=smart_data_processed.smart_pandas.config)
+    assert dataset.partition_columns == ["date"]
+    assert dataset.state == State(name=StateName.PROCESSED, ml_stage=MLStage.TRAINING)
+    assert dataset.validate() == {}
+    assert "date" not in next(dataset.iter_partitions()).columns
+    assert list(dataset.to_pandas().columns) == list(smart_data_processed.columns)
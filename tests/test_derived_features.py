@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.derived_features import DerivedFeatureEngine
+from smart_pandas.state import MLStage, State, StateName
+
+
+@pytest.fixture()
+def engine(smart_data_raw):
+    engine = DerivedFeatureEngine(smart_data_raw.smart_pandas.config)
+    engine.register("bmi", ["weight", "height"], lambda weight, height: weight / (height / 100) ** 2)
+    return engine
+
+
+def test_compute_derived_features(smart_data_raw, smart_data_processed, engine):
+    processed = smart_data_raw.smart_pandas.compute_derived_features(engine)
+
+    assert processed.smart_pandas.state == State(name=StateName.PROCESSED, ml_stage=MLStage.TRAINING)
+    pd.testing.assert_frame_equal(processed, smart_data_processed, check_dtype=False)
+    assert "bmi" not in smart_data_raw.columns
+
+
+def test_compute_derived_features_cache(smart_data_raw, engine):
+    calls = []
+    engine.register("bmi", ["weight", "height"], lambda weight, height: calls.append(1) or weight / height)
+
+    first = engine.compute(smart_data_raw)
+    second = engine.compute(smart_data_raw.copy())
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first["bmi"], second["bmi"])
+
+    changed = smart_data_raw.assign(height=smart_data_raw["height"] + 1)
+    engine.compute(changed)
+    assert len(calls) == 2
+
+    # re-registering the feature doesn't reuse the previous function's results
+    engine.register("bmi", ["weight", "height"], lambda weight, height: weight * 0)
+    assert (engine.compute(smart_data_raw)["bmi"] == 0).all()
+
+
+def test_register_validation(engine):
+    with pytest.raises(ValueError, match="not a derived feature"):
+        engine.register("age", ["weight"], lambda weight: weight)
+    with pytest.raises(ValueError, match="not in config"):
+        engine.register("bmi", ["shoe_size"], lambda shoe_size: shoe_size)
+
+
+def test_dependency_order(smart_data_raw):
+    config_dict = smart_data_raw.smart_pandas.config.model_dump(include={"name", "columns"})
+    config_dict["columns"]["columns"].append(
+        {"name": "bmi_squared", "data_schema": {"dtype": "float"}, "tags": ["derived_feature", "model_feature"]}
+    )
+    config = DataConfig(name=config_dict["name"], columns=config_dict["columns"]["columns"])
+    data = smart_data_raw.copy()
+    data.smart_pandas.load_config(config=config)
+
+    engine = DerivedFeatureEngine(config, max_workers=2)
+    engine.register("bmi_squared", ["bmi"], lambda bmi: bmi ** 2)
+    engine.register("bmi", ["weight", "height"], lambda weight, height: weight / (height / 100) ** 2)
+    processed = data.smart_pandas.compute_derived_features(engine)
+
+    assert list(processed.columns[-2:]) == ["bmi", "bmi_squared"]
+    np.testing.assert_allclose(processed["bmi_squared"], processed["bmi"] ** 2)
+    assert processed.smart_pandas.state.name == StateName.PROCESSED
+
+    engine.register("bmi", ["bmi_squared"], lambda bmi_squared: bmi_squared)
+    with pytest.raises(ValueError, match="circular dependency"):
+        engine.compute(data)
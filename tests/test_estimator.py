@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from sklearn.base import clone
+from sklearn.exceptions import NotFittedError
+from sklearn.linear_model import LinearRegression
+
+from smart_pandas.estimator import SmartPandasEstimator
+from smart_pandas.state import StateError
+
+
+def test_estimator_fit_predict(smart_data_processed):
+    config = smart_data_processed.smart_pandas.config
+    model = SmartPandasEstimator(LinearRegression(), config=config).fit(smart_data_processed)
+
+    expected = LinearRegression().fit(
+        smart_data_processed[config.model_features], smart_data_processed["life_expectancy"]
+    ).predict(smart_data_processed[config.model_features])
+    np.testing.assert_allclose(model.predict(smart_data_processed), expected)
+    np.testing.assert_allclose(model.predict(smart_data_processed.iloc[1:]), expected[1:])
+    np.testing.assert_allclose(model.predict(smart_data_processed[config.model_features].to_numpy()), expected)
+    np.testing.assert_array_equal(model.feature_names_in_, config.model_features)
+
+
+def test_estimator_reorders_columns(smart_data_processed):
+    config = smart_data_processed.smart_pandas.config
+    model = SmartPandasEstimator(LinearRegression(), config=config).fit(smart_data_processed)
+
+    fitted_indices = model.feature_indices_.copy()
+    reordered = smart_data_processed[smart_data_processed.columns[::-1]].drop(columns=["life_expectancy"])
+    np.testing.assert_allclose(model.predict(reordered), model.predict(smart_data_processed))
+    # predicting on a different layout doesn't change the fitted positions
+    np.testing.assert_array_equal(model.feature_indices_, fitted_indices)
+    assert model._columns.equals(smart_data_processed.columns)
+
+
+def test_estimator_errors(smart_data_raw):
+    model = SmartPandasEstimator(LinearRegression(), config=smart_data_raw.smart_pandas.config)
+    with pytest.raises(NotFittedError):
+        model.predict(smart_data_raw)
+    with pytest.raises(StateError, match="bmi"):
+        model.fit(smart_data_raw)
+
+
+def test_estimator_clone(smart_data_processed):
+    model = SmartPandasEstimator(LinearRegression(), config=smart_data_processed.smart_pandas.config)
+    assert clone(model).config.fingerprint == model.config.fingerprint
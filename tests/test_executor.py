@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from smart_pandas.config.config_utils import aread_config
+from smart_pandas.executor import ValidationExecutor
+
+
+def test_avalidate(smart_data_raw):
+    validated = asyncio.run(smart_data_raw.smart_pandas.avalidate())
+
+    pd.testing.assert_frame_equal(validated, smart_data_raw.smart_pandas.validate())
+    assert validated.smart_pandas.state == smart_data_raw.smart_pandas.state
+
+
+def test_aload_config(smart_data_raw):
+    data = smart_data_raw.copy()
+    config = asyncio.run(aread_config("tests/example_configs/example_config.yaml"))
+    asyncio.run(data.smart_pandas.aload_config(config=config))
+
+    assert data.smart_pandas.config is config
+    assert data.smart_pandas.state == smart_data_raw.smart_pandas.state
+
+
+def test_avalidate_not_initialized():
+    with pytest.raises(RuntimeError, match="not initialized"):
+        asyncio.run(pd.DataFrame({"a": [1]}).smart_pandas.avalidate())
+
+
+def test_executor_concurrency_limit():
+    executor = ValidationExecutor(max_workers=4, max_concurrency=2)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.pop()
+
+    async def main():
+        await asyncio.gather(*(executor.run(work) for _ in range(8)))
+
+    asyncio.run(main())
+    executor.shutdown()
+    assert max(peak) == 2
+
+
+def test_executor_cancellation():
+    executor = ValidationExecutor(max_workers=1)
+    started = []
+
+    async def main():
+        blocker = asyncio.ensure_future(executor.run(time.sleep, 0.05))
+        waiting = asyncio.ensure_future(executor.run(started.append, 1))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await blocker
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+
+    asyncio.run(main())
+    executor.shutdown()
+    assert started == []
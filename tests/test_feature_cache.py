@@ -0,0 +1,49 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import numpy as np
+import pytest
+
+from smart_pandas.feature_cache import FeatureCache
+
+
+def _sum_features(directory, key):
+    return float(FeatureCache(directory).load(key).arrays["model_features"].sum())
+
+
+def test_cache_features(smart_data_processed, tmp_path):
+    cache = FeatureCache(str(tmp_path))
+    first = smart_data_processed.smart_pandas.cache_features(cache)
+
+    assert first.columns == {"model_features": ["age", "bmi"], "target": ["life_expectancy"]}
+    np.testing.assert_allclose(first.arrays["model_features"], smart_data_processed[["age", "bmi"]].to_numpy())
+    assert first.arrays["target"].shape == (3,)
+    assert isinstance(first.arrays["model_features"], np.memmap)
+    assert not first.arrays["model_features"].flags.writeable
+    # no temporary directories are left behind
+    assert [path.name for path in tmp_path.iterdir()] == [first.key]
+
+    # a fresh copy of the same data maps the cached arrays
+    again = smart_data_processed.copy()
+    again.smart_pandas.load_config(config=smart_data_processed.smart_pandas.config)
+    assert again.smart_pandas.cache_features(str(tmp_path)).key == first.key
+
+    again.loc[0, "age"] = 40
+    assert again.smart_pandas.cache_features(cache).key != first.key
+    assert again.smart_pandas.cache_features(cache, data_key="v1").key != first.key
+
+
+def test_cache_features_other_process(smart_data_processed, tmp_path):
+    matrices = smart_data_processed.smart_pandas.cache_features(str(tmp_path))
+    expected = float(smart_data_processed[["age", "bmi"]].to_numpy().sum())
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        assert executor.submit(_sum_features, str(tmp_path), matrices.key).result() == pytest.approx(expected)
+
+
+def test_cache_features_errors(smart_data_processed, tmp_path):
+    with pytest.raises(ValueError, match="Unknown data attributes"):
+        smart_data_processed.smart_pandas.cache_features(str(tmp_path), ("not_a_group",))
+    with pytest.raises(ValueError, match="Only numeric columns"):
+        smart_data_processed.smart_pandas.cache_features(str(tmp_path), ("metadata",))
+    assert FeatureCache(str(tmp_path)).load("missing") is None
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from smart_pandas.group_index import GroupIndex
+
+
+@pytest.fixture
+def events():
+    rng = np.random.default_rng(0)
+    num_rows = 500
+    data = pd.DataFrame({
+        "user_id": rng.choice(["a", "b", "c", "d", None], num_rows),
+        "timestamp": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.permutation(num_rows), unit="h"),
+        "value": rng.normal(size=num_rows),
+    })
+    data.loc[rng.choice(num_rows, 50, replace=False), "value"] = np.nan
+    return data
+
+
+@pytest.mark.parametrize("func", ["sum", "mean", "min", "max", "count", "size", "first", "last"])
+def test_transform_matches_groupby(events, func):
+    expected = events.sort_values("timestamp").groupby("user_id")["value"].transform(func).reindex(events.index)
+    result = GroupIndex(events["user_id"], events["timestamp"]).transform(events["value"], func)
+    np.testing.assert_allclose(result, expected.to_numpy(dtype=float))
+
+
+def test_lag_and_rolling_match_groupby(events):
+    index = GroupIndex(events["user_id"], events["timestamp"])
+    grouped = events.sort_values("timestamp").groupby("user_id")["value"]
+
+    for periods in [1, 3, -2]:
+        expected = grouped.shift(periods).reindex(events.index)
+        np.testing.assert_allclose(index.lag(events["value"], periods), expected.to_numpy(dtype=float))
+
+    expected = grouped.rolling(4, min_periods=2).mean().droplevel(0).reindex(events.index)
+    np.testing.assert_allclose(index.rolling(events["value"], 4, min_periods=2), expected.to_numpy(dtype=float))
+    expected = grouped.expanding().sum().droplevel(0).reindex(events.index)
+    np.testing.assert_allclose(index.rolling(events["value"], None, "sum"), expected.to_numpy(dtype=float))
+
+    with pytest.raises(ValueError, match="Unsupported rolling function"):
+        index.rolling(events["value"], 4, "median")
+
+
+def test_accessor_group_index_is_cached(smart_data_processed):
+    index = smart_data_processed.smart_pandas.group_index()
+    assert index.ngroups == 3
+
+    smart_data_processed["age_mean"] = index.transform(smart_data_processed["age"], "mean")
+    assert smart_data_processed.smart_pandas.group_index() is index
+
+    smart_data_processed["user_id"] = ["1", "1", "2"]
+    rebuilt = smart_data_processed.smart_pandas.group_index()
+    assert rebuilt is not index and rebuilt.ngroups == 2
+    assert smart_data_processed.smart_pandas.group_index(rebuild=True) is not rebuilt
@@ -0,0 +1,80 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from smart_pandas.profiling import ColumnProfile, HyperLogLog, TDigest, merge_profiles, profile_columns
+
+
+def test_hyperloglog_estimate_and_merge():
+    first, second = HyperLogLog(), HyperLogLog()
+    first.add(np.arange(0, 60_000))
+    second.add(np.arange(40_000, 100_000))
+
+    assert first.estimate() == pytest.approx(60_000, rel=0.05)
+    assert first.merge(second).estimate() == pytest.approx(100_000, rel=0.05)
+    assert HyperLogLog().estimate() == 0
+
+
+def test_tdigest_quantiles_and_merge():
+    values = np.random.default_rng(0).normal(size=100_000)
+    first, second = TDigest(), TDigest()
+    first.add(values[:30_000])
+    second.add(values[30_000:])
+    merged = first.merge(second)
+
+    assert merged.count == len(values)
+    assert len(merged.means) < 1_000
+    # quantile estimates should be close in rank to the exact ones
+    quantiles = np.array([0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999])
+    ranks = np.searchsorted(np.sort(values), merged.quantile(quantiles)) / len(values)
+    np.testing.assert_allclose(ranks, quantiles, atol=0.002)
+    assert merged.quantile(0) == values.min() and merged.quantile(1) == values.max()
+
+
+def test_profile_columns():
+    data = pd.DataFrame({
+        "a": [1.0, 2.0, np.nan, 4.0],
+        "b": pd.array([1, None, 1, 3], dtype="Int64"),
+        "c": ["x", "y", None, "x"],
+    })
+    profiles = profile_columns(data, ["a", "b", "c"])
+
+    assert profiles["a"].count == 3 and profiles["a"].null_count == 1
+    assert profiles["a"].mean == pytest.approx(7 / 3)
+    assert profiles["a"].variance == pytest.approx(data["a"].var())
+    assert (profiles["b"].minimum, profiles["b"].maximum) == (1, 3)
+    assert round(profiles["b"].cardinality) == 2
+    assert not profiles["c"].is_numeric and profiles["c"].null_count == 1
+    assert round(profiles["c"].cardinality) == 2
+
+
+def test_merge_profiles_matches_full_profile():
+    data = pd.DataFrame({"a": np.random.default_rng(1).exponential(size=10_000), "b": np.arange(10_000) % 7})
+    chunks = [profile_columns(data.iloc[start:start + 4_000], ["a", "b"]) for start in range(0, len(data), 4_000)]
+    serialised = [{col: profile.to_dict() for col, profile in chunk.items()} for chunk in chunks]
+    restored = [
+        {col: ColumnProfile.from_dict(profile) for col, profile in json.loads(json.dumps(chunk)).items()}
+        for chunk in serialised
+    ]
+    merged = merge_profiles(*restored)
+    full = profile_columns(data, ["a", "b"])
+
+    for col in ["a", "b"]:
+        assert merged[col].count == full[col].count
+        assert merged[col].mean == pytest.approx(full[col].mean)
+        assert merged[col].variance == pytest.approx(full[col].variance)
+        assert merged[col].minimum == full[col].minimum and merged[col].maximum == full[col].maximum
+    assert merged["a"].quantile(0.5) == pytest.approx(data["a"].median(), rel=0.02)
+    assert round(merged["b"].cardinality) == 7
+
+
+def test_accessor_profile(smart_data_processed):
+    profiles = smart_data_processed.smart_pandas.profile()
+
+    assert list(profiles) == ["age", "bmi", "life_expectancy"]
+    assert profiles["age"].mean == pytest.approx(smart_data_processed["age"].mean())
+
+    with pytest.raises(ValueError, match="Unknown data attributes"):
+        smart_data_processed.smart_pandas.profile(("not_a_group",))
@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+import pandera as pa
+import pytest
+
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.schema import build_schema, find_null_columns, plan_validation
+from smart_pandas.registry import get_expected_dtypes
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@pytest.fixture()
+def arrow_config(smart_data_raw):
+    if pyarrow is None:
+        pytest.skip("pyarrow is not installed")
+    config_dict = smart_data_raw.smart_pandas.config.model_dump(include={"name", "columns"})
+    return DataConfig(name=config_dict["name"], columns=config_dict["columns"]["columns"], dtype_backend="pyarrow")
+
+
+def test_build_schema_arrow_dtypes(smart_data_raw, arrow_config):
+    schema = build_schema(arrow_config, smart_data_raw.smart_pandas.state)
+
+    assert schema.columns["user_id"].dtype.type == pd.ArrowDtype(pyarrow.string())
+    assert schema.columns["age"].dtype.type == pd.ArrowDtype(pyarrow.int64())
+    assert schema.columns["timestamp"].dtype.type == pd.ArrowDtype(pyarrow.timestamp("ns"))
+    assert arrow_config.fingerprint != smart_data_raw.smart_pandas.config.fingerprint
+
+
+def test_validate_arrow_data(smart_data_raw, arrow_config):
+    data = smart_data_raw.convert_dtypes(dtype_backend="pyarrow")
+    data["weight"] = data["weight"].astype("double[pyarrow]")
+    data["height"] = data["height"].astype("double[pyarrow]")
+    data.smart_pandas.load_config(config=arrow_config)
+    validated = data.smart_pandas.validate()
+
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in validated.dtypes)
+    # the string buffers are shared rather than converted to Python objects and back
+    original_buffers = data["name"].array.__arrow_array__().chunk(0).buffers()
+    validated_buffers = validated["name"].array.__arrow_array__().chunk(0).buffers()
+    assert validated_buffers[2].address == original_buffers[2].address
+
+
+def test_serialize_arrow_dtype(arrow_config):
+    config_dict = arrow_config.model_dump(include={"name", "columns", "dtype_backend"})
+    config_dict["columns"]["columns"][0]["data_schema"]["dtype"] = "string[pyarrow]"
+    config = DataConfig(name=config_dict["name"], columns=config_dict["columns"]["columns"])
+
+    serialized = config.model_dump(include={"columns"})["columns"]["columns"][0]["data_schema"]
+    assert serialized["dtype"] == "string[pyarrow]"
+
+
+def test_plan_validation(smart_data_raw):
+    accessor = smart_data_raw.smart_pandas
+    plan = plan_validation(accessor.schema, get_expected_dtypes(accessor.config, accessor.state), smart_data_raw)
+
+    # weight and height are ints in the data but floats in the config, object columns are always coerced
+    assert plan.coerce_columns == {"user_id", "name", "weight", "height"}
+    assert plan.fused_columns == {"timestamp", "age", "life_expectancy"}
+
+
+def test_find_null_columns():
+    data = pd.DataFrame({
+        "a": [1.0, 2.0, 3.0, np.nan, 5.0],
+        "b": [1.0, 2.0, 3.0, 4.0, 5.0],
+        "c": pd.to_datetime(["2020-01-01", None, "2020-01-03", "2020-01-04", "2020-01-05"]),
+        "d": [1, 2, 3, 4, 5],
+    })
+    assert find_null_columns(data, ["a", "b", "c", "d"]) == ["a", "c"]
+
+
+def test_validate_reports_fused_null_failures(smart_data_raw):
+    smart_data_raw["height"] = [180.0, np.nan, 185.0]
+
+    with pytest.raises(pa.errors.SchemaError, match="height"):
+        smart_data_raw.smart_pandas.validate(copy=False)
+
+
+def test_validate_coerces_mixed_object_columns(smart_data_raw):
+    smart_data_raw["user_id"] = pd.Series([1, "2", 3], dtype=object)
+    expected = pd.Series(["1", "2", "3"], name="user_id")
+
+    pd.testing.assert_series_equal(smart_data_raw.smart_pandas.validate()["user_id"], expected, check_dtype=False)
+    pd.testing.assert_series_equal(
+        smart_data_raw.smart_pandas.validate(copy=False)["user_id"], expected, check_dtype=False
+    )
+    smart_data_raw.smart_pandas.validate(inplace=True)
+    pd.testing.assert_series_equal(smart_data_raw["user_id"], expected, check_dtype=False)
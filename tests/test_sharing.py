@@ -0,0 +1,70 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import pandas as pd
+import pandera as pa
+import pytest
+
+from smart_pandas.config.config_utils import read_yaml
+from smart_pandas.config.data_config import DataConfig
+from smart_pandas.registry import get_config, register_config
+from smart_pandas.sharing import SharedFrame
+
+
+def _summarise(shared_frame):
+    data = shared_frame.open()
+    return str(data.smart_pandas.state), data.smart_pandas.is_validated, float(data.smart_pandas.model_features.sum().sum())
+
+
+def test_export_restore_state(smart_data_processed):
+    accessor_state = smart_data_processed.smart_pandas.export_state()
+    restored = smart_data_processed.copy()
+    restored.smart_pandas.restore_state(pickle.loads(pickle.dumps(accessor_state)))
+
+    assert restored.smart_pandas.config is smart_data_processed.smart_pandas.config
+    assert restored.smart_pandas.state == smart_data_processed.smart_pandas.state
+    assert restored.smart_pandas.schema is smart_data_processed.smart_pandas.schema
+
+
+def test_shared_frame(smart_data_processed):
+    validated = smart_data_processed.smart_pandas.validate()
+    with SharedFrame(validated) as shared_frame:
+        first = pickle.loads(pickle.dumps(shared_frame)).open()
+
+    pd.testing.assert_frame_equal(first, validated)
+    assert first.smart_pandas.is_validated
+    assert first.smart_pandas.state == validated.smart_pandas.state
+    # numeric columns are read-only views of the shared mapping rather than copies
+    assert not first["age"].to_numpy().flags.writeable
+
+
+def test_shared_frame_process_pool(smart_data_processed):
+    config = smart_data_processed.smart_pandas.config
+    expected = float(smart_data_processed[config.model_features].sum().sum())
+    with SharedFrame(smart_data_processed) as shared_frame, ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=register_config,
+        initargs=(config,),
+    ) as pool:
+        results = list(pool.map(_summarise, [shared_frame] * 2))
+
+    assert results == [("processed, training", False, expected)] * 2
+
+
+def test_registry_separates_configs_with_different_checks(smart_data_raw):
+    definition = read_yaml("tests/example_configs/example_config.yaml")
+    configs = []
+    for check in [pa.Check(lambda s: s > 0), pa.Check(lambda s: s < 0)]:
+        definition["columns"][3]["data_schema"] = pa.Column(float, checks=[check])
+        configs.append(register_config(DataConfig(**definition)))
+    positive, negative = configs
+
+    assert get_config(negative.fingerprint) is negative
+    data = smart_data_raw.assign(weight=-smart_data_raw["weight"])
+    data.smart_pandas.load_config(config=positive)
+    with pytest.raises(pa.errors.SchemaError):
+        data.smart_pandas.validate()
+    data.smart_pandas.load_config(config=negative)
+    data.smart_pandas.validate()
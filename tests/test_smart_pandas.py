@@ -1,3 +1,7 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from smart_pandas.state import State, StateName, MLStage
 
@@ -47,3 +51,49 @@ def test_smart_pandas_auto_update(smart_data_raw):
 
 def test_validate(smart_data_raw):
     smart_data_raw.smart_pandas.validate()
+
+
+def test_concurrent_readers_rebuild_once(smart_data_raw, monkeypatch):
+    accessor = smart_data_raw.smart_pandas
+    rebuilds = []
+    build_snapshot = accessor._build_snapshot
+    monkeypatch.setattr(accessor, "_build_snapshot", lambda *args: rebuilds.append(args) or build_snapshot(*args))
+    smart_data_raw.loc[:, "bmi"] = smart_data_raw["weight"] / (smart_data_raw["height"] / 100) ** 2
+
+    num_threads = 32
+    barrier = threading.Barrier(num_threads)
+
+    def read(_):
+        barrier.wait()
+        return [smart_data_raw.smart_pandas.model_features for _ in range(20)]
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        results = [frame for frames in executor.map(read, range(num_threads)) for frame in frames]
+
+    assert len(rebuilds) == 1
+    assert smart_data_raw.smart_pandas.state == State(name=StateName.PROCESSED, ml_stage=MLStage.TRAINING)
+    for frame in results:
+        pd.testing.assert_frame_equal(frame, smart_data_raw[["age", "bmi"]])
+
+
+def test_validate_without_copy(smart_data_raw):
+    validated = smart_data_raw.smart_pandas.validate(copy=False)
+
+    # age already has the right dtype so its data is shared, weight is coerced without changing the original
+    assert np.shares_memory(validated["age"].to_numpy(), smart_data_raw["age"].to_numpy())
+    assert validated["weight"].dtype == "float64" and smart_data_raw["weight"].dtype == "int64"
+    assert validated.smart_pandas.is_validated and not smart_data_raw.smart_pandas.is_validated
+    assert validated.smart_pandas.state == smart_data_raw.smart_pandas.state
+    pd.testing.assert_frame_equal(validated, smart_data_raw.smart_pandas.validate())
+
+
+def test_reload_config_edited_in_place(smart_data_raw):
+    config = smart_data_raw.smart_pandas.config
+    smart_data_raw.loc[0, "weight"] = None
+    fingerprint = config.fingerprint
+
+    next(column for column in config.columns if column.name == "weight").data_schema.nullable = True
+    smart_data_raw.smart_pandas.load_config(config=config)
+
+    assert config.fingerprint != fingerprint
+    assert smart_data_raw.smart_pandas.validate()["weight"].isna().sum() == 1
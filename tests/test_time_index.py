@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from smart_pandas.time_index import TimeIndex
+
+
+@pytest.fixture()
+def smart_data_daily(smart_data_raw):
+    data = pd.concat([smart_data_raw] * 4, ignore_index=True)
+    data["user_id"] = [str(i) for i in range(len(data))]
+    data["timestamp"] = pd.date_range("2020-01-01", periods=len(data), freq="D")
+    data.smart_pandas.load_config(config=smart_data_raw.smart_pandas.config)
+    return data
+
+
+def test_time_index_unsorted():
+    timestamps = pd.Series(pd.to_datetime(["2020-01-03", "2020-01-01", "2020-01-02", "2020-01-01"]))
+    time_index = TimeIndex(timestamps)
+    assert not time_index.is_sorted
+
+    lo, hi = time_index.positions(end="2020-01-02", inclusive_end=True)
+    data = pd.DataFrame({"a": [0, 1, 2, 3]})
+    np.testing.assert_array_equal(time_index.take(data, lo, hi)["a"], [1, 2, 3])
+
+
+def test_time_index_excludes_nat():
+    timestamps = pd.Series(pd.to_datetime(["2020-01-03", None, "2020-01-01", "2020-01-02"]))
+    time_index = TimeIndex(timestamps)
+
+    assert len(time_index) == 3
+    assert time_index.positions(start="2020-01-02") == (1, 3)
+    data = pd.DataFrame({"a": [0, 1, 2, 3]})
+    np.testing.assert_array_equal(time_index.take(data, *time_index.positions())["a"], [0, 2, 3])
+    assert list(time_index.sliding_windows("1D"))[-1] == (2, 3)
+
+
+def test_time_split(smart_data_daily):
+    train, valid, test = smart_data_daily.smart_pandas.time_split("2020-01-06", "2020-01-10")
+
+    assert len(train) == 5 and len(valid) == 4 and len(test) == 3
+    assert train["timestamp"].max() < pd.Timestamp("2020-01-06") <= valid["timestamp"].min()
+    assert np.shares_memory(train["age"].to_numpy(), smart_data_daily["age"].to_numpy())
+    assert test.smart_pandas.config is smart_data_daily.smart_pandas.config
+    assert test.smart_pandas.state == smart_data_daily.smart_pandas.state
+
+
+def test_as_of(smart_data_daily):
+    assert len(smart_data_daily.smart_pandas.as_of("2020-01-03")) == 3
+    assert len(smart_data_daily.smart_pandas.as_of("2020-01-03", inclusive=False)) == 2
+
+
+def test_time_index_rebuilt_when_timestamps_replaced(smart_data_daily):
+    assert len(smart_data_daily.smart_pandas.as_of("2020-01-03")) == 3
+    smart_data_daily["timestamp"] = pd.date_range("2019-12-29", periods=len(smart_data_daily), freq="D")
+    smart_data_daily.smart_pandas.update()
+    assert len(smart_data_daily.smart_pandas.as_of("2020-01-03")) == 6
+
+
+def test_windows(smart_data_daily):
+    sliding = list(smart_data_daily.smart_pandas.sliding_windows("5D", step="3D"))
+    assert [len(window) for window in sliding] == [5, 5, 5, 3]
+
+    expanding = list(smart_data_daily.smart_pandas.expanding_windows("5D"))
+    assert [len(window) for window in expanding] == [5, 10, 12]
+    assert expanding[0].smart_pandas.state == smart_data_daily.smart_pandas.state
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from smart_pandas.uniqueness import BloomFilter, KeySet, find_duplicate_positions, find_duplicates, hash_keys
+
+
+def test_find_duplicate_positions():
+    keys = pd.Series(["a", "b", "a", None, "c", "b", None, "a"])
+    np.testing.assert_array_equal(find_duplicate_positions(keys), [2, 5, 7])
+
+
+def test_find_duplicate_positions_no_duplicates():
+    assert len(find_duplicate_positions(pd.Series([3, 1, 2]))) == 0
+
+
+def test_find_duplicates(smart_data_raw):
+    report = smart_data_raw.smart_pandas.find_duplicates()
+    assert not report.has_duplicates
+
+    duplicated = pd.concat([smart_data_raw, smart_data_raw.iloc[[1]]], ignore_index=True)
+    duplicated.smart_pandas.load_config(config=smart_data_raw.smart_pandas.config)
+    np.testing.assert_array_equal(duplicated.smart_pandas.find_duplicates().within_batch, [3])
+
+
+def test_find_duplicates_across_batches(smart_data_raw, tmp_path):
+    key_set = KeySet()
+    smart_data_raw.smart_pandas.find_duplicates(key_store=key_set, update_store=True)
+    key_set.save(tmp_path / "keys.npy")
+
+    next_batch = smart_data_raw.copy()
+    next_batch["user_id"] = ["3", "4", "5"]
+    next_batch.smart_pandas.load_config(config=smart_data_raw.smart_pandas.config)
+    report = next_batch.smart_pandas.find_duplicates(key_store=KeySet.load(tmp_path / "keys.npy"))
+    np.testing.assert_array_equal(report.across_batches, [0])
+
+
+def test_find_duplicates_ignores_null_keys():
+    key_set = KeySet()
+    find_duplicates(pd.Series(["a", None]), key_store=key_set, update_store=True)
+    assert len(key_set) == 1
+
+    report = find_duplicates(pd.Series([None, "b", "a"]), key_store=key_set)
+    np.testing.assert_array_equal(report.across_batches, [2])
+
+
+def test_bloom_filter(tmp_path):
+    seen = hash_keys(pd.Series(np.arange(10_000)))
+    unseen = hash_keys(pd.Series(np.arange(10_000, 20_000)))
+    bloom_filter = BloomFilter(capacity=10_000, false_positive_rate=0.01)
+    bloom_filter.add(seen)
+    bloom_filter.save(tmp_path / "keys.npz")
+
+    loaded = BloomFilter.load(tmp_path / "keys.npz")
+    assert loaded.contains(seen).all()
+    assert loaded.contains(unseen).mean() < 0.02
@@ -0,0 +1,113 @@
+import os
+import shutil
+
+import pytest
+
+from smart_pandas.config.watcher import ConfigWatcher, diff_configs, get_watcher
+from smart_pandas.registry import get_schema
+from smart_pandas.state import State, StateName
+
+EXAMPLE_CONFIG = "tests/example_configs/example_config.yaml"
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "config.yaml"
+    shutil.copy(EXAMPLE_CONFIG, path)
+    return path
+
+
+def edit_config(path, old, new):
+    """Edit the config file, moving its modification time forward so the change is always detected."""
+    stat = path.stat()
+    path.write_text(path.read_text().replace(old, new, 1))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+BMI_SCHEMA = 'name: "bmi",\n      data_schema: {"dtype": "float"}'
+WEIGHT_SCHEMA = 'name: "weight",\n      data_schema: {"dtype": "float"}'
+WEIGHT_TAGS = 'tags: ["raw_feature"],\n      description: "Weight'
+
+
+def test_diff_configs(config_path, load_config):
+    old = load_config("example_config")
+    edit_config(config_path, BMI_SCHEMA, BMI_SCHEMA.replace("float", "int"))
+    edit_config(config_path, WEIGHT_TAGS, WEIGHT_TAGS.replace('"raw_feature"', '"raw_feature", "model_feature"'))
+    new = ConfigWatcher(str(config_path)).config
+
+    diff = diff_configs(old, new)
+    assert diff.schema_changed_columns == ["bmi"]
+    assert diff.retagged_columns == ["weight"]
+    assert diff.changed_data_attributes == ["model_features"]
+    assert not diff.added_columns and not diff.removed_columns
+    assert diff_configs(old, old).is_empty
+
+
+def test_watcher_reloads_changed_file(config_path):
+    watcher = ConfigWatcher(str(config_path), check_interval=0)
+    old = watcher.config
+    changes = []
+    watcher.on_change(lambda *args: changes.append(args))
+
+    assert watcher.config is old
+    edit_config(config_path, BMI_SCHEMA, BMI_SCHEMA.replace("float", "int"))
+    new = watcher.config
+    assert new is not old and new.fingerprint != old.fingerprint
+    assert [(change[0], change[1]) for change in changes] == [(old, new)]
+    assert watcher.diff_from(old) is changes[0][2]
+
+    edit_config(config_path, "columns: [", "columns: [[")
+    with pytest.warns(UserWarning, match="keeping the previous config"):
+        assert watcher.config is new
+
+
+def test_watcher_keeps_config_of_deleted_file(config_path):
+    watcher = ConfigWatcher(str(config_path), check_interval=0)
+    old = watcher.config
+    text = config_path.read_text()
+
+    config_path.unlink()
+    with pytest.warns(UserWarning, match="keeping the previous config"):
+        assert watcher.config is old
+
+    config_path.write_text(text.replace('"float"', '"int"', 1))
+    assert watcher.config.fingerprint != old.fingerprint
+
+def test_watcher_migrates_unaffected_schemas(config_path):
+    watcher = ConfigWatcher(str(config_path), check_interval=0)
+    old = watcher.config
+    ml_stage = State.from_columns([], old).ml_stage
+    raw, processed = State(StateName.RAW, ml_stage), State(StateName.PROCESSED, ml_stage)
+    raw_schema, processed_schema = get_schema(old, raw), get_schema(old, processed)
+
+    # bmi is only part of the processed state
+    edit_config(config_path, BMI_SCHEMA, BMI_SCHEMA.replace("float", "int"))
+    new = watcher.config
+    assert get_schema(new, raw) is raw_schema
+    assert get_schema(new, processed) is not processed_schema
+    assert get_schema(new, processed).columns["bmi"].dtype != processed_schema.columns["bmi"].dtype
+
+
+def test_accessor_follows_watched_config(smart_data_raw, config_path):
+    smart_data_raw.smart_pandas.load_config(config_path=str(config_path), watch=True)
+    watcher = get_watcher(str(config_path))
+    assert smart_data_raw.smart_pandas.config is watcher.config
+    smart_data_raw.smart_pandas.validate(inplace=True)
+    schema = smart_data_raw.smart_pandas.schema
+
+    # model features are incompatible with the raw state, so its schema and validation are carried over
+    edit_config(config_path, WEIGHT_TAGS, WEIGHT_TAGS.replace('"raw_feature"', '"raw_feature", "model_feature"'))
+    assert watcher.check()
+    assert list(smart_data_raw.smart_pandas.raw_features.columns) == ["weight", "height", "age"]
+    assert smart_data_raw.smart_pandas.config is watcher.config
+    assert smart_data_raw.smart_pandas.schema is schema
+    assert smart_data_raw.smart_pandas.is_validated
+
+    edit_config(config_path, WEIGHT_SCHEMA, WEIGHT_SCHEMA.replace("float", "int"))
+    assert watcher.check()
+    _ = smart_data_raw.smart_pandas.raw_features
+    assert smart_data_raw.smart_pandas.schema.columns["weight"].dtype != schema.columns["weight"].dtype
+    assert not smart_data_raw.smart_pandas.is_validated
+
+    with pytest.raises(ValueError, match="config_path must be provided"):
+        smart_data_raw.smart_pandas.load_config(config=watcher.config, watch=True)